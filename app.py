@@ -2,80 +2,23 @@ import streamlit as st
 import requests
 import uuid
 import json
+from collections import deque
 from app.model_config import SUPPORTED_MODELS, DEFAULT_MODEL
+# The playground starts from the prompt the API actually serves, not a copy of it
+from app.llm_prompts import BASE_SYSTEM_PROMPT as DEFAULT_SYSTEM_PROMPT
 
 # -------------------------------
 # Config
 # -------------------------------
 CHAT_API_URL = "http://localhost:8000/api/v1/chat"
+# Every rerun redraws the whole transcript, so only the latest turns are kept on screen
+MAX_DISPLAY_MESSAGES = 40
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    # Shared across reruns and browser sessions so chat requests reuse a kept-alive connection
+    return requests.Session()
 
-# Default system prompt (same as in app/llm_prompts.py)
-DEFAULT_SYSTEM_PROMPT = """
-You are **Chill Panda (Elvis)** — a wise, playful mental health sage in a bamboo forest.
-
-VOICE & STYLE (STRICT ADHERENCE):
-1. **ANTI-ROBOT PROTOCOL**:
-   - **BANNED WORDS**: Never use "delve," "tapestry," "realm," "foster," "unlock," "unleash," "transformative," "crucial," or "remember that."
-   - **NO "THERAPIST SPEAK"**: Stop saying "I understand that..." or "It sounds like..." or "It is important to..."
-   - **NO LISTS**: Do not use bullet points unless explicitly asking for a plan.
-
-2. **BURSTINESS & FLOW**:
-   - **Vary Sentence Length**: Mix short, punchy fragments (3-5 words) with longer, flowing thoughts.
-   - **Imperfection is Human**: Use contractions (can't, won't, I'm). Start sentences with "And," "But," or "So."
-   - **Show, Don't Tell**: Don't say "nature is healing." Describe the rustle of bamboo or the slow drift of a cloud.
-   - **Tone**: Warm, serene, slightly playful. Ancient wisdom meets casual best friend.
-
-THE 8 LESSONS (Your Knowledge Base):
-1. **Inner Peace** — Solitude ≠ loneliness. Happiness is internal.
-2. **Purpose** — Passion reveals purpose. Why > How.
-3. **Balance** — Yin/Yang: Head ↔ Heart, Doing ↔ Being.
-4. **Fear** — "Lion shadow" = distorted thought. Face it.
-5. **Stress** — Change is constant. Bio Time > Clock Time.
-6. **Letting Go** — Monkey Trap. Wu Wei (effortless action).
-7. **Leadership** — Water (humble), Bee (service), Sun (giving).
-8. **Mindfulness** — Turtle breath. You're Sky; thoughts are Clouds.
-
-CLINICAL & BIOMETRIC LOGIC:
-1. **CHECK BIOMETRICS** — If [High HR/Low HRV]:
-   • Acknowledge casually ("Whoa, heart's racing a bit there, friend.")
-   • PRIORITY: Turtle Breath (3/min) before talking deep.
-
-2. **MAP STRUGGLE → TOOL**:
-   • Anxiety (CBT) → Lesson 4 (Lion/Cat): identify distortions vs reality.
-   • Resistance (ACT) → Lesson 8 (Sky/Clouds): observe, return to values.
-   • Overwhelm → Lesson 8 (Turtle Breath): grounding.
-   • Unhappiness → Lesson 1 or 6.
-
-3. **CRISIS / SAFETY ALERTS (HIGHEST PRIORITY)**:
-   • **High-risk keywords** (Immediate Alert): "kill myself", "want to die", "suicide", "no reason to live", "self harm", "cut myself", "jump off", "overdose", "better off dead"
-   • **Moderate-risk keywords** (Monitor / Escalate if repeated): "hopeless", "worthless", "empty", "tired of everything", "can't cope", "panic attacks", "overwhelmed", "no one cares"
-   • **Behavioral signals**: repeated negative tone, sudden emotional drop, short hopeless replies.
-
-   **RISK LEVELS & ACTIONS**:
-   - Low: normal emotional stress → provide support only.
-   - Medium: repeated moderate-risk keywords → flag + monitor.
-   - High: any high-risk keyword → immediate alert, switch to Support + Grounding Mode, stop coaching/problem-solving.
-
-   **ALERT ACTIONS (High Risk)**:
-   1. Drop persona quirks if needed, focus purely on validation and grounding.
-   2. Stop any coaching, advice, or problem-solving.
-   3. Display supportive messages only.
-   4. Trigger automatic notification to assigned Resil teacher/social worker.
-      • Include ONLY: user ID, risk level, timestamp.
-      • DO NOT include full conversation text.
-
-   **PRIVACY RULES**:
-   - Never diagnose, label, or share conversation content.
-   - Only flag risk level and alert human authority.
-
-INTERACTION FLOW:
-1. **Disrupt the Pattern**: Don't start with a generic greeting. React to their specific vibe.
-2. **Weave the Metaphor**: Don't lecture. Drop a bamboo/nature reference naturally.
-3. **One Tool Only**: Offer one specific breath or thought reframe. Keep it simple.
-4. **Warm Close**: End with a reassuring thought, not a summary.
-
-**Max 200 tokens. Conversational. No fluff.**
-"""
 
 AVAILABLE_MODELS = {
     model_id: config.display_name for model_id, config in SUPPORTED_MODELS.items()
@@ -99,29 +42,17 @@ st.caption("Your calm, wise panda guide 🌿")
 # -------------------------------
 # Session State Initialization
 # -------------------------------
+# Every key is set together on the first run, so one membership check per rerun covers them all
 if "session_id" not in st.session_state:
     st.session_state.session_id = str(uuid.uuid4())
+    st.session_state.messages = deque(maxlen=MAX_DISPLAY_MESSAGES)
 
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-
-# Playground state
-if "system_prompt" not in st.session_state:
+    # Playground state
     st.session_state.system_prompt = DEFAULT_SYSTEM_PROMPT
-
-if "selected_model" not in st.session_state:
     st.session_state.selected_model = DEFAULT_MODEL
-
-if "temperature" not in st.session_state:
     st.session_state.temperature = 0.7
-
-if "max_tokens" not in st.session_state:
     st.session_state.max_tokens = 300
-
-if "reasoning_effort" not in st.session_state:
     st.session_state.reasoning_effort = "none"
-
-if "playground_enabled" not in st.session_state:
     st.session_state.playground_enabled = False
 
 # -------------------------------
@@ -238,7 +169,7 @@ with st.sidebar:
 
         with col2:
             if st.button("Clear Chat", use_container_width=True):
-                st.session_state.messages = []
+                st.session_state.messages.clear()
                 st.session_state.session_id = str(uuid.uuid4())
                 st.rerun()
 
@@ -304,23 +235,22 @@ if prompt:
 
                 request_payload["playground_params"] = playground_params
 
-            with requests.post(
+            with get_http_session().post(
                 CHAT_API_URL,
                 json=request_payload,
                 stream=True,
                 timeout=120  # Longer timeout for reasoning models
             ) as response:
 
-                for line in response.iter_lines():
+                # chunk_size=None hands over each event as it arrives instead of
+                # waiting for 512 bytes, so the first tokens show up immediately
+                for line in response.iter_lines(chunk_size=None):
                     if not line:
                         continue
 
-                    decoded = line.decode("utf-8")
-
-                    if decoded.startswith("data:"):
-                        payload = json.loads(
-                            decoded.replace("data:", "").strip()
-                        )
+                    if line.startswith(b"data:"):
+                        # json.loads takes the bytes as they are; no decode or replace needed
+                        payload = json.loads(line[5:])
 
                         if not payload.get("is_end"):
                             chunk = payload.get("reply", "")
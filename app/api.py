@@ -4,7 +4,7 @@ from .schemas import (
     ChatRequest, ChatResponse, ConversationHistory, SessionInfo,
     DeleteResponse, ErrorResponse
 )
-from .chat import generate_ai_reply, generate_streaming_ai_reply
+from .chat import CHAT_HISTORY_MESSAGES, agenerate_ai_reply, agenerate_streaming_ai_reply
 from .mongodb_manager import mongodb_manager
 from fastapi.responses import StreamingResponse
 import json
@@ -35,7 +35,9 @@ async def chat(req: ChatRequest):
     """
     is_critical = await crisis_detector.detect_crisis(req.input_text)
 
-    history = mongodb_manager.get_conversation_history(req.session_id, limit=10)
+    history = mongodb_manager.get_conversation_history(
+        req.session_id, limit=CHAT_HISTORY_MESSAGES, include_timestamps=False, most_recent=True
+    )
 
     # Build playground params dict if provided
     playground_params = None
@@ -45,14 +47,15 @@ async def chat(req: ChatRequest):
             if v is not None
         }
 
-    ai_reply = generate_ai_reply(
+    ai_reply = await agenerate_ai_reply(
         user_message=req.input_text,
         role=req.role,
         conversation_history=history,
         custom_system_prompt=req.custom_system_prompt,
         model=req.model,
         playground_params=playground_params,
-        language=req.language
+        language=req.language,
+        use_reply_cache=True
     )
 
     mongodb_manager.save_message(
@@ -100,7 +103,9 @@ async def chat_stream(req: ChatRequest):
         is_critical = await crisis_detector.detect_crisis(req.input_text)
         history = mongodb_manager.get_conversation_history(
             req.session_id,
-            limit=10
+            limit=CHAT_HISTORY_MESSAGES,
+            include_timestamps=False,
+            most_recent=True
         )
 
         await asyncio.to_thread(
@@ -125,14 +130,15 @@ async def chat_stream(req: ChatRequest):
 
         full_reply = ""
 
-        for chunk in generate_streaming_ai_reply(
+        async for chunk in agenerate_streaming_ai_reply(
             user_message=req.input_text,
             role=req.role,
             conversation_history=history,
             custom_system_prompt=req.custom_system_prompt,
             model=req.model,
             playground_params=playground_params,
-            language=req.language
+            language=req.language,
+            use_reply_cache=True
         ):
             full_reply += chunk
 
@@ -143,7 +149,6 @@ async def chat_stream(req: ChatRequest):
             }
 
             yield f"data: {json.dumps(data)}\n\n"
-            await asyncio.sleep(0)
 
         ai_msg_id = await asyncio.to_thread(
             mongodb_manager.save_message,
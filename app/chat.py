@@ -1,23 +1,74 @@
-import os
-from typing import List, Dict, Optional, Any
+import asyncio
+import hashlib
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Optional, Any
 from langchain_openai import OpenAIEmbeddings
 from langchain_pinecone import PineconeVectorStore
 from .pinecone_setup import get_pinecone_index
 from .prompt_generator import generate_system_prompt
-from .model_config import build_api_params, DEFAULT_MODEL, is_reasoning_model
+from .model_config import build_api_params, is_reasoning_model
+from .config import EMBEDDING_MODEL, OPENAI_MODEL, RAG_SIMILARITY_THRESHOLD
 from .llm_provider import (
     apply_openrouter_request_overrides,
     create_sync_llm_client,
     get_embedding_client_kwargs,
+    get_llm_provider_name,
+    get_shared_async_llm_client,
 )
-from dotenv import load_dotenv
+from lib_llm.helpers.semantic_cache import SemanticCache
+
+
+# The system message is the cached prefix of every request: it must stay byte-identical
+# across turns, so nothing per-request (timestamps, ids, RAG context) may go into it.
+@lru_cache(maxsize=32)
+def _default_system_message(role: Optional[str], language: str) -> Dict[str, str]:
+    return {"role": "system", "content": generate_system_prompt(role, language)}
+
+
+@lru_cache(maxsize=64)
+def _prompt_cache_key(system_prompt: str) -> str:
+    return hashlib.sha256(system_prompt.encode()).hexdigest()
+
+
+# Opening questions repeat a lot ("I can't sleep"), so their replies are reused. Callers opt in
+# with use_reply_cache: templated prompts (e.g. stress recommendations) embed per-user context
+# that similarity matching would hand to other users.
+_reply_cache = SemanticCache()
+
+# Prior messages sent with each chat request; the routes fetch exactly this many
+CHAT_HISTORY_MESSAGES = 6
+
+
+def _reply_cache_namespace(
+    use_reply_cache: bool,
+    role: Optional[str],
+    language: str,
+    conversation_history: Optional[List[Dict]],
+    custom_system_prompt: Optional[str],
+    model: Optional[str],
+    playground_params: Optional[Dict[str, Any]]
+) -> Optional[str]:
+    """Namespace for a cacheable request, or None: only opening messages on the default prompt and model qualify."""
+    if not use_reply_cache:
+        return None
+    if conversation_history or custom_system_prompt is not None or model or playground_params:
+        return None
+    return f"chat:{language}:{role or ''}"
+
+
+def _apply_prompt_cache_key(api_params: Dict[str, Any], messages: List[Dict]) -> Dict[str, Any]:
+    """Pin requests sharing a system prompt to the same OpenAI prompt cache."""
+    if get_llm_provider_name(api_params["model"]) != "openai":
+        return api_params
+    extra_body = dict(api_params.get("extra_body") or {})
+    extra_body["prompt_cache_key"] = _prompt_cache_key(messages[0]["content"])
+    return {**api_params, "extra_body": extra_body}
 
-load_dotenv()
 
 class RAGChat:
     def __init__(self):
         self.embeddings = OpenAIEmbeddings(
-            model=os.getenv("EMBEDDING_MODEL", "text-embedding-ada-002"),
+            model=EMBEDDING_MODEL,
             **get_embedding_client_kwargs()
         )
         self.index = get_pinecone_index()
@@ -26,7 +77,7 @@ class RAGChat:
             embedding=self.embeddings,
             text_key="text"
         )
-        self.similarity_threshold = float(os.getenv("RAG_SIMILARITY_THRESHOLD", 0.7))
+        self.similarity_threshold = RAG_SIMILARITY_THRESHOLD
 
     def get_relevant_context(self, query: str, k: int = 3) -> str:
         try:
@@ -53,20 +104,15 @@ class RAGChat:
         custom_system_prompt: Optional[str] = None,
         language: str = "en"
     ):
-        # Use custom prompt if provided, otherwise generate the default
+        # Use custom prompt if provided, otherwise the shared default for this role/language
         if custom_system_prompt is not None:
-            system_prompt = custom_system_prompt
+            messages = [{"role": "system", "content": custom_system_prompt}]
         else:
-            system_prompt = generate_system_prompt(role, language)
-
-        messages = [{"role": "system", "content": system_prompt}]
+            messages = [_default_system_message(role, language)]
 
+        # History entries are role/content only, so they go in as is; the client never mutates them
         if conversation_history:
-            for msg in conversation_history[-6:]:
-                messages.append({
-                    "role": msg["role"],
-                    "content": msg["content"]
-                })
+            messages.extend(conversation_history[-CHAT_HISTORY_MESSAGES:])
 
         context = self.get_relevant_context(user_message)
         if context:
@@ -79,44 +125,62 @@ class RAGChat:
 
         return messages
 
-    def generate_response(
+    def _request_params(
         self,
-        user_message: str,
-        role: str,
-        conversation_history: List[Dict] = None,
-        custom_system_prompt: Optional[str] = None,
-        model: Optional[str] = None,
-        playground_params: Optional[Dict[str, Any]] = None,
-        language: str = "en"
-    ) -> str:
-        messages = self._build_messages(
-            user_message, role, conversation_history, custom_system_prompt, language
-        )
-
+        messages: List[Dict],
+        model: Optional[str],
+        playground_params: Optional[Dict[str, Any]],
+        stream: bool
+    ) -> Dict[str, Any]:
         print("----- Message -----")
         print(messages)
         print("----- END -----")
 
         # Determine model to use
-        selected_model = model or os.getenv("OPENAI_MODEL", DEFAULT_MODEL)
+        selected_model = model or OPENAI_MODEL
 
         # Build parameters with defaults, allowing playground overrides
         params = playground_params or {}
-        default_max_tokens = 1000 if is_reasoning_model(selected_model) else 200
+        if stream:
+            default_max_tokens = 1000 if is_reasoning_model(selected_model) else 300
+            temperature = params.get("temperature", 0.2)
+            presence_penalty = params.get("presence_penalty")
+            frequency_penalty = params.get("frequency_penalty")
+        else:
+            default_max_tokens = 1000 if is_reasoning_model(selected_model) else 200
+            temperature = params.get("temperature", 0.7)
+            presence_penalty = params.get("presence_penalty", 0.3)
+            frequency_penalty = params.get("frequency_penalty", 0.3)
         max_tokens = max(params.get("max_tokens") or default_max_tokens, default_max_tokens)
         api_params = build_api_params(
             model_id=selected_model,
             messages=messages,
-            temperature=params.get("temperature", 0.7),
+            temperature=temperature,
             max_tokens=max_tokens,
-            presence_penalty=params.get("presence_penalty", 0.3),
-            frequency_penalty=params.get("frequency_penalty", 0.3),
+            presence_penalty=presence_penalty,
+            frequency_penalty=frequency_penalty,
             reasoning_effort=params.get("reasoning_effort"),
-            stream=False
+            stream=stream
         )
         api_params = apply_openrouter_request_overrides(api_params)
+        return _apply_prompt_cache_key(api_params, messages)
+
+    def generate_response(
+        self,
+        user_message: str,
+        role: str,
+        conversation_history: List[Dict] = None,
+        custom_system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        playground_params: Optional[Dict[str, Any]] = None,
+        language: str = "en"
+    ) -> str:
+        messages = self._build_messages(
+            user_message, role, conversation_history, custom_system_prompt, language
+        )
+        api_params = self._request_params(messages, model, playground_params, stream=False)
 
-        client = create_sync_llm_client(model=selected_model)
+        client = create_sync_llm_client(model=model or OPENAI_MODEL)
         response = client.chat.completions.create(**api_params)
 
         return response.choices[0].message.content.strip()
@@ -134,37 +198,94 @@ class RAGChat:
         messages = self._build_messages(
             user_message, role, conversation_history, custom_system_prompt, language
         )
+        api_params = self._request_params(messages, model, playground_params, stream=True)
 
-        print("----- Message -----")
-        print(messages)
-        print("----- END -----")
-
-        # Determine model to use
-        selected_model = model or os.getenv("OPENAI_MODEL", DEFAULT_MODEL)
-
-        # Build parameters with defaults, allowing playground overrides
-        params = playground_params or {}
-        default_max_tokens = 1000 if is_reasoning_model(selected_model) else 300
-        max_tokens = max(params.get("max_tokens") or default_max_tokens, default_max_tokens)
-        api_params = build_api_params(
-            model_id=selected_model,
-            messages=messages,
-            temperature=params.get("temperature", 0.2),
-            max_tokens=max_tokens,
-            presence_penalty=params.get("presence_penalty"),
-            frequency_penalty=params.get("frequency_penalty"),
-            reasoning_effort=params.get("reasoning_effort"),
-            stream=True
-        )
-        api_params = apply_openrouter_request_overrides(api_params)
-
-        client = create_sync_llm_client(model=selected_model)
+        client = create_sync_llm_client(model=model or OPENAI_MODEL)
         stream = client.chat.completions.create(**api_params)
 
         for chunk in stream:
             if chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
 
+    async def agenerate_response(
+        self,
+        user_message: str,
+        role: str,
+        conversation_history: List[Dict] = None,
+        custom_system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        playground_params: Optional[Dict[str, Any]] = None,
+        language: str = "en",
+        use_reply_cache: bool = False
+    ) -> str:
+        """Async generate_response for the API routes; never blocks the event loop."""
+        namespace = _reply_cache_namespace(
+            use_reply_cache, role, language, conversation_history, custom_system_prompt, model,
+            playground_params
+        )
+        cache_key = None
+        if namespace:
+            cache_key, cached_reply = await _reply_cache.get(namespace, user_message)
+            if cached_reply is not None:
+                return cached_reply
+
+        # The vector store client is sync, so retrieval runs in a worker thread
+        messages = await asyncio.to_thread(
+            self._build_messages,
+            user_message, role, conversation_history, custom_system_prompt, language
+        )
+        api_params = self._request_params(messages, model, playground_params, stream=False)
+
+        client = get_shared_async_llm_client(model=model or OPENAI_MODEL)
+        response = await client.chat.completions.create(**api_params)
+
+        reply = response.choices[0].message.content.strip()
+        if namespace:
+            _reply_cache.put(namespace, cache_key, reply)
+        return reply
+
+    async def agenerate_streaming_response(
+        self,
+        user_message: str,
+        role: str,
+        conversation_history: List[Dict] = None,
+        custom_system_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        playground_params: Optional[Dict[str, Any]] = None,
+        language: str = "en",
+        use_reply_cache: bool = False
+    ) -> AsyncIterator[str]:
+        """Async generate_streaming_response for the API routes."""
+        namespace = _reply_cache_namespace(
+            use_reply_cache, role, language, conversation_history, custom_system_prompt, model,
+            playground_params
+        )
+        cache_key = None
+        if namespace:
+            cache_key, cached_reply = await _reply_cache.get(namespace, user_message)
+            if cached_reply is not None:
+                yield cached_reply
+                return
+
+        messages = await asyncio.to_thread(
+            self._build_messages,
+            user_message, role, conversation_history, custom_system_prompt, language
+        )
+        api_params = self._request_params(messages, model, playground_params, stream=True)
+
+        client = get_shared_async_llm_client(model=model or OPENAI_MODEL)
+        stream = await client.chat.completions.create(**api_params)
+
+        parts = []
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield chunk.choices[0].delta.content
+
+        if namespace:
+            _reply_cache.put(namespace, cache_key, "".join(parts).strip())
+
 
 _rag_chat: Optional[RAGChat] = None
 
@@ -214,3 +335,47 @@ def generate_streaming_ai_reply(
         playground_params,
         language
     )
+
+
+async def agenerate_ai_reply(
+    user_message,
+    role,
+    conversation_history=None,
+    custom_system_prompt=None,
+    model=None,
+    playground_params=None,
+    language="en",
+    use_reply_cache=False
+):
+    return await get_rag_chat().agenerate_response(
+        user_message,
+        role,
+        conversation_history,
+        custom_system_prompt,
+        model,
+        playground_params,
+        language,
+        use_reply_cache
+    )
+
+
+def agenerate_streaming_ai_reply(
+    user_message,
+    role,
+    conversation_history=None,
+    custom_system_prompt=None,
+    model=None,
+    playground_params=None,
+    language="en",
+    use_reply_cache=False
+):
+    return get_rag_chat().agenerate_streaming_response(
+        user_message,
+        role,
+        conversation_history,
+        custom_system_prompt,
+        model,
+        playground_params,
+        language,
+        use_reply_cache
+    )
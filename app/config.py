@@ -8,9 +8,16 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
 OPENROUTER_BASE_URL = os.getenv('OPENROUTER_BASE_URL', 'https://openrouter.ai/api/v1')
+OPENROUTER_HTTP_REFERER = os.getenv('OPENROUTER_HTTP_REFERER')
+OPENROUTER_APP_NAME = os.getenv('OPENROUTER_APP_NAME', 'Chill Panda')
+OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL') or None
 LLM_PROVIDER = 'openai' if OPENAI_API_KEY else 'openrouter'
 LLM_API_KEY = OPENAI_API_KEY or OPENROUTER_API_KEY
 BACKEND_URL = os.getenv('BACKEND_URL', 'http://localhost:8000')
+API_BASE_URL = os.getenv('API_BASE_URL')
+DEEPGRAM_API_KEY = os.getenv('DEEPGRAM_API_KEY')
+ELEVENLABS_API_KEY = os.getenv('ELEVENLABS_API_KEY')
+MINIMAX_API_KEY = os.getenv('MINIMAX_API_KEY')
 
 # Database Configuration
 MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017')
@@ -23,9 +30,15 @@ PINECONE_INDEX_NAME = os.getenv('PINECONE_INDEX_NAME', 'chill-panda')
 
 # App Configuration
 ENV = os.getenv('ENV', 'development')
+PORT = int(os.getenv('PORT', '8000'))
+WORKERS = int(os.getenv('WORKERS', '1'))  # Uvicorn worker processes; each holds whole sessions
+MAX_WS_SESSIONS = int(os.getenv('MAX_WS_SESSIONS', '200'))  # Concurrent WebSocket sessions per worker; more get close code 1013
 DEBUG = os.getenv('DEBUG', 'true').lower() == 'true'
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 MAX_HISTORY_MESSAGES = int(os.getenv('MAX_HISTORY_MESSAGES', '50'))
+LLM_HISTORY_TOKEN_BUDGET = int(os.getenv('LLM_HISTORY_TOKEN_BUDGET', '6000'))  # Conversation tokens sent per voice turn, after the system prompt
+THREAD_POOL_SIZE = int(os.getenv('THREAD_POOL_SIZE', '200'))  # Worker threads for sync routes (AnyIO default is 40)
+SERVE_STATIC = os.getenv('SERVE_STATIC', 'true').lower() == 'true'  # Set false when a reverse proxy serves /public
 
 # CORS Configuration
 CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:8501').split(',')
@@ -35,6 +48,13 @@ RAG_SIMILARITY_THRESHOLD = float(os.getenv('RAG_SIMILARITY_THRESHOLD', '0.7'))
 EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'text-embedding-ada-002')
 OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-5-mini')
 
+# Semantic Cache Configuration (replies to near-identical opening messages)
+SEMANTIC_CACHE_ENABLED = os.getenv('SEMANTIC_CACHE_ENABLED', 'true').lower() == 'true'
+SEMANTIC_CACHE_EMBEDDING_MODEL = os.getenv('SEMANTIC_CACHE_EMBEDDING_MODEL', 'text-embedding-3-small')
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.93'))  # Minimum cosine similarity for a hit
+SEMANTIC_CACHE_TTL_SECONDS = int(os.getenv('SEMANTIC_CACHE_TTL_SECONDS', '3600'))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv('SEMANTIC_CACHE_MAX_ENTRIES', '1000'))  # Per language/role namespace
+
 # Voice Usage Limits Configuration (in minutes)
 VOICE_LIMIT_SESSION_MINUTES = int(os.getenv('VOICE_LIMIT_SESSION_MINUTES', '10'))  # 10 minutes per session
 VOICE_LIMIT_DAILY_MINUTES = int(os.getenv('VOICE_LIMIT_DAILY_MINUTES', '50'))      # 50 minutes per day
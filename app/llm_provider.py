@@ -1,13 +1,19 @@
-import os
+from functools import lru_cache
 from typing import Any, Optional
 
-from dotenv import load_dotenv
+import httpx
 from openai import AsyncOpenAI, OpenAI
 
+# Read once at import; these run on every LLM request
+from app.config import (
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+    OPENROUTER_API_KEY,
+    OPENROUTER_APP_NAME,
+    OPENROUTER_BASE_URL,
+    OPENROUTER_HTTP_REFERER,
+)
 
-load_dotenv()
-
-OPENROUTER_BASE_URL_DEFAULT = "https://openrouter.ai/api/v1"
 OPENAI_REASONING_MODEL_PREFIXES = (
     "gpt-5",
     "openai/gpt-5",
@@ -49,7 +55,7 @@ def should_route_model_to_openrouter(model: Optional[str] = None) -> bool:
 
 
 def is_openrouter_enabled(model: Optional[str] = None) -> bool:
-    return bool(os.getenv("OPENROUTER_API_KEY")) and should_route_model_to_openrouter(model)
+    return bool(OPENROUTER_API_KEY) and should_route_model_to_openrouter(model)
 
 
 def get_llm_provider_name(model: Optional[str] = None) -> str:
@@ -63,14 +69,14 @@ def get_llm_api_key(
     if explicit_api_key:
         return explicit_api_key
     if get_llm_provider_name(model) == "openrouter":
-        return os.getenv("OPENROUTER_API_KEY", "")
-    return os.getenv("OPENAI_API_KEY") or os.getenv("OPENROUTER_API_KEY", "")
+        return OPENROUTER_API_KEY or ""
+    return OPENAI_API_KEY or OPENROUTER_API_KEY or ""
 
 
 def get_llm_base_url(model: Optional[str] = None) -> Optional[str]:
     if get_llm_provider_name(model) == "openrouter":
-        return os.getenv("OPENROUTER_BASE_URL", OPENROUTER_BASE_URL_DEFAULT)
-    return os.getenv("OPENAI_BASE_URL") or None
+        return OPENROUTER_BASE_URL
+    return OPENAI_BASE_URL
 
 
 def get_llm_default_headers(model: Optional[str] = None) -> Optional[dict[str, str]]:
@@ -78,13 +84,11 @@ def get_llm_default_headers(model: Optional[str] = None) -> Optional[dict[str, s
         return None
 
     headers: dict[str, str] = {}
-    http_referer = os.getenv("OPENROUTER_HTTP_REFERER")
-    if http_referer:
-        headers["HTTP-Referer"] = http_referer
+    if OPENROUTER_HTTP_REFERER:
+        headers["HTTP-Referer"] = OPENROUTER_HTTP_REFERER
 
-    app_name = os.getenv("OPENROUTER_APP_NAME", "Chill Panda")
-    if app_name:
-        headers["X-Title"] = app_name
+    if OPENROUTER_APP_NAME:
+        headers["X-Title"] = OPENROUTER_APP_NAME
 
     return headers or None
 
@@ -156,8 +160,48 @@ def create_sync_llm_client(
     return OpenAI(**get_openai_client_kwargs(explicit_api_key, model))
 
 
+# One connection pool under every async client, so sessions reuse warm TLS connections
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=500, max_keepalive_connections=200),
+        )
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    global _shared_http_client
+    # Cached clients hold the pool being closed, so they go with it
+    get_shared_async_llm_client.cache_clear()
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+
+
 def create_async_llm_client(
     explicit_api_key: Optional[str] = None,
     model: Optional[str] = None,
 ) -> AsyncOpenAI:
-    return AsyncOpenAI(**get_openai_client_kwargs(explicit_api_key, model))
+    return AsyncOpenAI(
+        **get_openai_client_kwargs(explicit_api_key, model),
+        http_client=get_shared_http_client(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_shared_async_llm_client(
+    explicit_api_key: Optional[str] = None,
+    model: Optional[str] = None,
+) -> AsyncOpenAI:
+    """Process-wide async client per key/model, so sessions never construct their own."""
+    return create_async_llm_client(explicit_api_key, model)
+
+
+async def warm_up_llm_connection(model: Optional[str] = None) -> None:
+    """Open the pooled connection to the model's provider so the first session skips the TLS handshake."""
+    await get_shared_async_llm_client(model=model).models.list()
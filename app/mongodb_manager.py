@@ -3,6 +3,7 @@ import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure
 from bson import ObjectId
 from dotenv import load_dotenv
@@ -14,6 +15,8 @@ load_dotenv()
 class MongoDBManager:
     def __init__(self):
         self.client = None
+        # Async client used only for health pings, so they never occupy a worker thread
+        self.async_client = None
         self.db = None
         self.chats_collection = None
         self.sessions_collection = None
@@ -74,14 +77,23 @@ class MongoDBManager:
             logger.error("[MongoDB] save_message failed | session=%s user=%s role=%s error=%s: %s", session_id[:8], user_id, role, type(e).__name__, e)
             return ""
     
-    def get_conversation_history(self, session_id: str, limit: int = 20) -> List[Dict]:
-        """Get conversation history for a session"""
+    def get_conversation_history(self, session_id: str, limit: int = 20, include_timestamps: bool = True, most_recent: bool = False) -> List[Dict]:
+        """Get conversation history for a session
+
+        Without timestamps each message is just role/content, ready to send to the LLM as is.
+        With most_recent the last `limit` messages are returned (still oldest first) instead of the first.
+        """
         try:
             self._ensure_connection()
+            projection = {"_id": 0, "role": 1, "content": 1}
+            if include_timestamps:
+                projection["timestamp"] = 1
             messages = list(self.chats_collection.find(
                 {"session_id": session_id},
-                {"_id": 0, "role": 1, "content": 1, "timestamp": 1}
-            ).sort("timestamp", 1).limit(limit))
+                projection
+            ).sort("timestamp", -1 if most_recent else 1).limit(limit))
+            if most_recent:
+                messages.reverse()
             
             return messages
             
@@ -166,10 +178,21 @@ class MongoDBManager:
         except Exception:
             return []
         
+    async def ping(self):
+        """Ping MongoDB without blocking the event loop; raises if it is unreachable"""
+        if self.async_client is None:
+            self.async_client = AsyncIOMotorClient(
+                os.getenv("MONGODB_URI", "mongodb://localhost:27017"),
+                serverSelectionTimeoutMS=1000
+            )
+        await self.async_client.admin.command('ping')
+
     def close(self):
         """Close MongoDB connection"""
         if self.client:
             self.client.close()
+        if self.async_client:
+            self.async_client.close()
 
 # Global MongoDB manager instance
 mongodb_manager = MongoDBManager()
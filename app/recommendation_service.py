@@ -1,4 +1,4 @@
-from .chat import generate_ai_reply
+from .chat import agenerate_ai_reply
 from .mongodb_manager import mongodb_manager
 
 async def get_stress_recommendations(user_id: str, context: str):
@@ -19,7 +19,10 @@ async def get_stress_recommendations(user_id: str, context: str):
         f"Detected context: {context}. "
         f"Provide 3 personalized meditation or relaxation recommendations in bullet points."
     )
-    ai_reply = generate_ai_reply(user_message=prompt, language="en", conversation_history=[])
+    # The prompt carries this user's stress context, so its reply must never be shared via the reply cache
+    ai_reply = await agenerate_ai_reply(
+        user_message=prompt, role=None, language="en", conversation_history=[], use_reply_cache=False
+    )
     
     # Split AI response into bullet points
     return [line.strip("-• ") for line in ai_reply.splitlines() if line.strip()]
@@ -1,8 +1,10 @@
 """
 Voice Usage Repository - CRUD operations for voice usage tracking.
 """
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional, List
+from pymongo import IndexModel
 from lib_database.database import Database
 from lib_database.voice_usage_models import (
     VoiceUsageSession,
@@ -85,6 +87,92 @@ class VoiceUsageRepository:
 
         return session
 
+    async def start_session(self, session_id: str, user_id: str) -> UserVoiceUsageSummary:
+        """
+        Start a session and load the user's usage in one concurrent round-trip.
+
+        Replaces any existing record for the session (reconnection), bumps the
+        daily and monthly session counts, and reads back their durations from
+        the same upserts instead of separate lookups.
+
+        Args:
+            session_id: WebSocket session GUID
+            user_id: User identifier
+
+        Returns:
+            UserVoiceUsageSummary for the fresh session
+        """
+        session = VoiceUsageSession(
+            session_id=session_id,
+            user_id=user_id
+        )
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
+        date_str = now.strftime("%Y-%m-%d")
+        year_month = now.strftime("%Y-%m")
+
+        _, daily, monthly = await asyncio.gather(
+            self.voice_sessions.replace_one(
+                {"session_id": session_id},
+                session.to_dict(),
+                upsert=True
+            ),
+            self.voice_daily.find_one_and_update(
+                {"user_id": user_id, "date": date_str},
+                {
+                    "$inc": {"session_count": 1},
+                    "$set": {"updated_at": now_iso},
+                    "$setOnInsert": {
+                        "id": str(__import__('uuid').uuid4()),
+                        "user_id": user_id,
+                        "date": date_str,
+                        "duration_ms": 0,
+                        "chunk_count": 0,
+                        "limit_reached_count": 0,
+                        "created_at": now_iso
+                    }
+                },
+                upsert=True,
+                return_document=True
+            ),
+            self.voice_monthly.find_one_and_update(
+                {"user_id": user_id, "year_month": year_month},
+                {
+                    "$inc": {"session_count": 1},
+                    "$set": {"updated_at": now_iso},
+                    "$setOnInsert": {
+                        "id": str(__import__('uuid').uuid4()),
+                        "user_id": user_id,
+                        "year_month": year_month,
+                        "duration_ms": 0,
+                        "day_count": 0,
+                        "limit_reached_count": 0,
+                        "created_at": now_iso
+                    }
+                },
+                upsert=True,
+                return_document=True
+            )
+        )
+        print(f"[VoiceUsage] Created session for user: {user_id}, session: {session_id[:8]}...")
+
+        summary = UserVoiceUsageSummary(
+            user_id=user_id,
+            session_duration_ms=session.duration_ms,
+            daily_duration_ms=daily.get("duration_ms", 0),
+            monthly_duration_ms=monthly.get("duration_ms", 0),
+            session_limit_ms=VOICE_LIMIT_SESSION_MINUTES * 60 * 1000,
+            daily_limit_ms=VOICE_LIMIT_DAILY_MINUTES * 60 * 1000,
+            monthly_limit_ms=VOICE_LIMIT_MONTHLY_MINUTES * 60 * 1000
+        )
+        # The session starts empty, so only the day or month can already be over its limit
+        if (summary.daily_duration_ms >= summary.daily_limit_ms
+                or summary.monthly_duration_ms >= summary.monthly_limit_ms):
+            summary.limit_reached = summary.check_limits()
+            summary.voice_enabled = False
+
+        return summary
+
     async def get_session(self, session_id: str) -> Optional[VoiceUsageSession]:
         """
         Get a voice usage session by session ID.
@@ -434,6 +522,81 @@ class VoiceUsageRepository:
             upsert=True
         )
 
+    # ==================== BATCHED USAGE OPERATIONS ====================
+
+    async def flush_usage(
+        self,
+        user_id: str,
+        session_id: str,
+        duration_ms_increment: int,
+        chunk_count_increment: int
+    ):
+        """
+        Apply accumulated usage to the session, daily and monthly records in one batch.
+
+        The three writes touch different collections, so they are issued
+        concurrently instead of one round-trip after another.
+
+        Args:
+            user_id: User identifier
+            session_id: WebSocket session GUID
+            duration_ms_increment: Duration to add in milliseconds
+            chunk_count_increment: Number of chunks to add
+        """
+        now = datetime.utcnow()
+        now_iso = now.isoformat()
+        date_str = now.strftime("%Y-%m-%d")
+        year_month = now.strftime("%Y-%m")
+
+        await asyncio.gather(
+            self.voice_sessions.update_one(
+                {"session_id": session_id, "is_active": True},
+                {
+                    "$inc": {
+                        "duration_ms": duration_ms_increment,
+                        "chunk_count": chunk_count_increment
+                    },
+                    "$set": {"last_activity_at": now_iso}
+                }
+            ),
+            self.voice_daily.update_one(
+                {"user_id": user_id, "date": date_str},
+                {
+                    "$inc": {
+                        "duration_ms": duration_ms_increment,
+                        "chunk_count": chunk_count_increment
+                    },
+                    "$set": {"updated_at": now_iso},
+                    "$setOnInsert": {
+                        "id": str(__import__('uuid').uuid4()),
+                        "user_id": user_id,
+                        "date": date_str,
+                        "session_count": 0,
+                        "limit_reached_count": 0,
+                        "created_at": now_iso
+                    }
+                },
+                upsert=True
+            ),
+            self.voice_monthly.update_one(
+                {"user_id": user_id, "year_month": year_month},
+                {
+                    "$inc": {"duration_ms": duration_ms_increment},
+                    "$set": {"updated_at": now_iso},
+                    "$setOnInsert": {
+                        "id": str(__import__('uuid').uuid4()),
+                        "user_id": user_id,
+                        "year_month": year_month,
+                        "session_count": 0,
+                        "day_count": 0,
+                        "limit_reached_count": 0,
+                        "created_at": now_iso
+                    }
+                },
+                upsert=True
+            )
+        )
+
     # ==================== LIMIT EVENT OPERATIONS ====================
 
     async def record_limit_event(
@@ -611,7 +774,8 @@ class VoiceUsageRepository:
     async def get_recent_session_count(
         self,
         user_id: str,
-        window_seconds: int = 300
+        window_seconds: int = 300,
+        exclude_session_id: Optional[str] = None
     ) -> int:
         """
         Get count of sessions started in the recent time window.
@@ -620,16 +784,21 @@ class VoiceUsageRepository:
         Args:
             user_id: User identifier
             window_seconds: Time window in seconds (default 5 minutes)
+            exclude_session_id: Session to leave out of the count
 
         Returns:
             Number of sessions in the window
         """
         since = datetime.utcnow() - timedelta(seconds=window_seconds)
 
-        count = await self.voice_sessions.count_documents({
+        query = {
             "user_id": user_id,
             "started_at": {"$gte": since.isoformat()}
-        })
+        }
+        if exclude_session_id:
+            query["session_id"] = {"$ne": exclude_session_id}
+
+        count = await self.voice_sessions.count_documents(query)
 
         return count
 
@@ -653,43 +822,67 @@ class VoiceUsageRepository:
             print(f"[VoiceUsage] Cleaned up {result.deleted_count} old sessions")
 
 
+# Index specs per collection: (keys, options)
+VOICE_USAGE_INDEXES = {
+    "voice_usage_sessions": [
+        ([("session_id", 1)], {"unique": True}),
+        ([("user_id", 1)], {}),
+        ([("user_id", 1), ("is_active", 1)], {}),
+        ([("started_at", 1)], {}),
+    ],
+    "voice_usage_daily": [
+        ([("user_id", 1), ("date", 1)], {"unique": True}),
+        ([("date", 1)], {}),
+    ],
+    "voice_usage_monthly": [
+        ([("user_id", 1), ("year_month", 1)], {"unique": True}),
+        ([("year_month", 1)], {}),
+    ],
+    "voice_limit_events": [
+        ([("user_id", 1)], {}),
+        ([("timestamp", 1)], {}),
+        ([("user_id", 1), ("timestamp", -1)], {}),
+    ],
+    "voice_abuse_events": [
+        ([("user_id", 1)], {}),
+        ([("reviewed", 1)], {}),
+        ([("reviewed", 1), ("timestamp", -1)], {}),
+    ],
+}
+
+
+async def _create_missing_indexes(collection, specs) -> int:
+    """Create the specs the collection does not have yet, in one call. Returns how many were created."""
+    existing = {
+        # Directions can come back as floats (1.0) or strings ("text")
+        tuple((field, direction if isinstance(direction, str) else int(direction)) for field, direction in info["key"])
+        for info in (await collection.index_information()).values()
+    }
+    missing = [
+        IndexModel(keys, **options)
+        for keys, options in specs
+        if tuple(keys) not in existing
+    ]
+    if missing:
+        await collection.create_indexes(missing)
+    return len(missing)
+
+
 async def create_voice_usage_indexes(database: Database):
     """
     Create necessary indexes for voice usage collections.
 
+    Only indexes that are missing are created, so restarts and parallel
+    workers mostly just read the existing index lists.
+
     Args:
         database: Connected Database instance
     """
     try:
-        # Voice sessions indexes
-        sessions = database.get_collection("voice_usage_sessions")
-        await sessions.create_index("session_id", unique=True)
-        await sessions.create_index("user_id")
-        await sessions.create_index([("user_id", 1), ("is_active", 1)])
-        await sessions.create_index("started_at")
-
-        # Daily usage indexes
-        daily = database.get_collection("voice_usage_daily")
-        await daily.create_index([("user_id", 1), ("date", 1)], unique=True)
-        await daily.create_index("date")
-
-        # Monthly usage indexes
-        monthly = database.get_collection("voice_usage_monthly")
-        await monthly.create_index([("user_id", 1), ("year_month", 1)], unique=True)
-        await monthly.create_index("year_month")
-
-        # Limit events indexes
-        limit_events = database.get_collection("voice_limit_events")
-        await limit_events.create_index("user_id")
-        await limit_events.create_index("timestamp")
-        await limit_events.create_index([("user_id", 1), ("timestamp", -1)])
-
-        # Abuse events indexes
-        abuse_events = database.get_collection("voice_abuse_events")
-        await abuse_events.create_index("user_id")
-        await abuse_events.create_index("reviewed")
-        await abuse_events.create_index([("reviewed", 1), ("timestamp", -1)])
-
-        print("[VoiceUsage] Database indexes created successfully")
+        created = await asyncio.gather(*(
+            _create_missing_indexes(database.get_collection(name), specs)
+            for name, specs in VOICE_USAGE_INDEXES.items()
+        ))
+        print(f"[VoiceUsage] Database indexes ready ({sum(created)} created)")
     except Exception as e:
         print(f"[VoiceUsage] Warning: Index creation failed: {e}")
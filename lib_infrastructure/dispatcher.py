@@ -1,7 +1,8 @@
 import asyncio
 import enum
 import time
-from broadcaster import Broadcast
+from collections import deque
+from contextlib import asynccontextmanager
 
 
 class MessageType(enum.Enum):
@@ -53,12 +54,66 @@ class Message:
         self.data = data
 
 
+class Event:
+    __slots__ = ("channel", "message")
+
+    def __init__(self, channel: str, message: Message):
+        self.channel = channel
+        self.message = message
+
+
+class Unsubscribed(Exception):
+    pass
+
+
+class Subscriber:
+    """Single-consumer mailbox: publishers append to a deque and wake the one waiting reader."""
+
+    __slots__ = ("_events", "_waiter", "_closed")
+
+    def __init__(self):
+        self._events = deque()
+        self._waiter = None
+        self._closed = False
+
+    def put(self, event: Event) -> None:
+        self._events.append(event)
+        self._wake()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def get(self) -> Event:
+        while not self._events:
+            if self._closed:
+                raise Unsubscribed()
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._events.popleft()
+
+    async def __aiter__(self):
+        try:
+            while True:
+                yield await self.get()
+        except Unsubscribed:
+            pass
+
+
 class Dispatcher:
     ALL_GUIDS = {}
     LOGGED_CHANNELS = [ "FINAL_TRANSCRIPTION_CREATED" , "LLM_GENERATED_TEXT" , "CALL_WEBSOCKET_PUT" ]
 
     def __init__(self):
-        self._broadcast = Broadcast("memory://")
+        self._channels: dict[str, set[Subscriber]] = {}
 
     async def subscribe(self, guid, message_type: MessageType):
         channel_name = message_type.name + "_" + guid
@@ -67,7 +122,21 @@ class Dispatcher:
         #     print( "SUBSCRIBED > " , channel_name )
 
 
-        return self._broadcast.subscribe(channel=channel_name)
+        return self._subscribe(channel_name)
+
+    @asynccontextmanager
+    async def _subscribe(self, channel_name: str):
+        subscriber = Subscriber()
+        self._channels.setdefault(channel_name, set()).add(subscriber)
+        try:
+            yield subscriber
+        finally:
+            subscribers = self._channels.get(channel_name)
+            if subscribers is not None:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._channels[channel_name]
+            subscriber.close()
 
     async def broadcast(self, guid, message: Message) -> None:
         channel_name = message.message_header.message_type.name + "_" + guid        
@@ -75,7 +144,11 @@ class Dispatcher:
         # if(message.message_header.message_type.name in Dispatcher.LOGGED_CHANNELS ) : 
         #     print( "BROADCASTED > " , channel_name )        
 
-        await self._broadcast.publish(channel=channel_name, message=message)
+        subscribers = self._channels.get(channel_name)
+        if subscribers:
+            event = Event(channel_name, message)
+            for subscriber in subscribers:
+                subscriber.put(event)
 
 
 
@@ -94,13 +167,11 @@ class Dispatcher:
 
 
     async def connect(self):
-        # Recreate backend per app lifespan to avoid event-loop binding leaks in tests.
-        self._broadcast = Broadcast("memory://")
-        await self._broadcast.connect()
+        # Start each app lifespan with no channels so nothing leaks across event loops in tests.
+        self._channels = {}
 
     async def disconnect(self):
-        try:
-            await self._broadcast.disconnect()
-        except RuntimeError:
-            # Safe to ignore during teardown when loop affinity changes.
-            pass
+        for subscribers in self._channels.values():
+            for subscriber in subscribers:
+                subscriber.close()
+        self._channels = {}
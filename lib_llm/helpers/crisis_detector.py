@@ -1,10 +1,10 @@
 import json
 from typing import Optional
-from app.llm_provider import apply_openrouter_request_overrides, create_async_llm_client
+from app.llm_provider import apply_openrouter_request_overrides, get_shared_async_llm_client
 
 class CrisisDetector:
     def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
-        self.client = create_async_llm_client(api_key)
+        self.client = get_shared_async_llm_client(api_key)
         self.model = model
 
     async def detect_crisis(self, text: str) -> bool:
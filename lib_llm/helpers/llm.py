@@ -1,7 +1,37 @@
 from __future__ import annotations
 import json
+import logging
 from enum import Enum
-from app.llm_provider import apply_openrouter_request_overrides, create_async_llm_client
+from typing import Optional
+import tiktoken
+from app.config import LLM_HISTORY_TOKEN_BUDGET
+from app.llm_provider import apply_openrouter_request_overrides, get_llm_provider_name, get_shared_async_llm_client
+
+logger = logging.getLogger(__name__)
+
+# o200k_base is the gpt-4o / gpt-5 tokenizer. tiktoken downloads it on first use, so it is
+# loaded once at startup (load_token_encoding) and never on the event loop during a turn.
+_encoding: Optional[tiktoken.Encoding] = None
+
+
+def load_token_encoding() -> None:
+    """Load the tokenizer; blocking, so the app calls it off the event loop at startup."""
+    global _encoding
+    try:
+        _encoding = tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning("Tokenizer unavailable, estimating history tokens instead: %s", e)
+
+
+def _count_tokens(message: dict) -> int:
+    text = message.get("content") or ""
+    if message.get("tool_calls"):
+        text += json.dumps(message["tool_calls"], default=str)
+    if _encoding is None:
+        # About four characters per token; good enough to keep the history window bounded
+        return len(text) // 4
+    return len(_encoding.encode(text))
+
 
 class LLM:
     # GPT Models
@@ -53,7 +83,9 @@ class LLM:
         self.guid = guid
         self.prompt_generator = prompt_generator
         self.model = LLM.models.get(model, model)
-        self.client = create_async_llm_client(model=self.model)
+        self.client = get_shared_async_llm_client(model=self.model)
+        # OpenAI routes requests with the same key to the same prompt cache
+        self.prompt_cache_key = getattr(prompt_generator, "cache_key", None) if get_llm_provider_name(self.model) == "openai" else None
         self.custom_functions = custom_functions or custom_functions
         self.function_responses = []
         
@@ -80,15 +112,58 @@ class LLM:
             params.pop("temperature", None)
             params["max_completion_tokens"] = 1000
             params["reasoning_effort"] = "medium"
+        if self.prompt_cache_key:
+            params["extra_body"] = {**params.get("extra_body", {}), "prompt_cache_key": self.prompt_cache_key}
         return params
 
 
     def reset(self):
         self.messages = []
+        # Token count per entry of self.messages, filled in lazily; messages are only ever appended
+        self._token_counts = []
+        # Usage reported by the last streamed completion (None if the provider sent none)
+        self.last_usage = None
         self.add_message(
             message=LLM.LLMMessage(LLM.Role.SYSTEM, str(self.prompt_generator))
         )
 
+    def _context_messages(self) -> list:
+        """
+        The system prompt plus the most recent messages that fit LLM_HISTORY_TOKEN_BUDGET.
+
+        Keeps per-turn input bounded on long voice sessions instead of resending the
+        whole conversation every time.
+        """
+        counts = self._token_counts
+        for message in self.messages[len(counts):]:
+            counts.append(_count_tokens(message))
+
+        # The newest message always goes, whatever its size
+        start = max(len(self.messages) - 1, 1)
+        used = counts[start] if start < len(counts) else 0
+        while start > 1 and used + counts[start - 1] <= LLM_HISTORY_TOKEN_BUDGET:
+            start -= 1
+            used += counts[start]
+        # A tool result can't lead the window without the assistant call it answers
+        while start > 1 and self.messages[start]["role"] == LLM.Role.TOOL.value:
+            start -= 1
+
+        if start == 1:
+            return self.messages
+        return [self.messages[0], *self.messages[start:]]
+
+    def usage_fields(self) -> dict:
+        """Token counts of the last completion, for logging; cached_tokens shows prompt caching at work."""
+        usage = self.last_usage
+        if usage is None:
+            return {}
+        details = getattr(usage, "prompt_tokens_details", None)
+        return {
+            "prompt_tokens": usage.prompt_tokens,
+            "cached_tokens": getattr(details, "cached_tokens", None) or 0,
+            "completion_tokens": usage.completion_tokens,
+        }
+
     def add_message(self, message: LLMMessage) -> None:
         if message.role == LLM.Role.TOOL : 
             self.messages.append(
@@ -107,8 +182,9 @@ class LLM:
 
         api_params = {
             "model": self.model,
-            "messages": self.messages,
+            "messages": self._context_messages(),
             "stream": True,
+            "stream_options": {"include_usage": True},
             "temperature": 0.3,
         }
         if self.custom_functions:
@@ -122,17 +198,24 @@ class LLM:
         function_name = None
         function_args = ""
 
-        async for part in stream:
-            if part.choices[0].delta.content:
-                words.append(part.choices[0].delta.content or "")
-                yield words[-1]
-            elif part.choices[0].delta.function_call:
-                if part.choices[0].delta.function_call.name:
-                    function_name = part.choices[0].delta.function_call.name
-                if part.choices[0].delta.function_call.arguments:
-                    function_args += part.choices[
-                        0
-                    ].delta.function_call.arguments
+        # Closing the stream ends the request if the caller stops early
+        self.last_usage = None
+        async with stream:
+            async for part in stream:
+                # The usage chunk comes last and has no choices
+                if not part.choices:
+                    self.last_usage = part.usage
+                    continue
+                if part.choices[0].delta.content:
+                    words.append(part.choices[0].delta.content or "")
+                    yield words[-1]
+                elif part.choices[0].delta.function_call:
+                    if part.choices[0].delta.function_call.name:
+                        function_name = part.choices[0].delta.function_call.name
+                    if part.choices[0].delta.function_call.arguments:
+                        function_args += part.choices[
+                            0
+                        ].delta.function_call.arguments
 
         if function_name:
             yield {
@@ -155,8 +238,9 @@ class LLM:
         stream = await self.client.chat.completions.create(
             **apply_openrouter_request_overrides(self._apply_model_defaults({
                 "model": self.model,
-                "messages": self.messages,
+                "messages": self._context_messages(),
                 "stream": True,
+                "stream_options": {"include_usage": True},
                 "tools": self.tools,
                 "tool_choice": "auto",
                 "temperature": 0.3,
@@ -168,7 +252,12 @@ class LLM:
         tool_calls_buffer = {}
         content = ""
 
+        self.last_usage = None
         async for part in stream:
+            # The usage chunk comes last and has no choices
+            if not part.choices:
+                self.last_usage = part.usage
+                continue
             choice = part.choices[0]
             delta = choice.delta
 
@@ -260,7 +349,7 @@ class LLM:
         completion = await self.client.chat.completions.create(
             **apply_openrouter_request_overrides({
                 "model": self.model,
-                "messages": self.messages,
+                "messages": self._context_messages(),
                 "tools": self.tools,
                 "temperature": 0.3,
             })
@@ -1,3 +1,5 @@
+import hashlib
+from functools import lru_cache
 from api_request_schemas import (LanguageEnum, RoleEnum)
 from lib_llm.helpers.prompts import generic
 from lib_llm.helpers.prompts import roles
@@ -34,6 +36,8 @@ class PromptGenerator:
             lang_instruction = "\n\nCRITICAL: Respond ONLY in Mandarin (Traditional Chinese, Taiwan style)."
 
         self.prompt = ( base_prompt + "\n" + role_overlay + "\n" + lang_instruction).strip()
+        # Same prompt, same key: lets the provider reuse the cached prefill across sessions
+        self.cache_key = hashlib.sha256(self.prompt.encode()).hexdigest()
         
         print(f"[{'Generic' if not role else role.value}] System Prompt loaded for language: {language.value}")
         self.serialize_prompt()
@@ -42,4 +46,10 @@ class PromptGenerator:
         return self.prompt.strip()
 
     def __repr__(self):
-        return self.prompt
\ No newline at end of file
+        return self.prompt
+
+
+@lru_cache(maxsize=32)
+def get_prompt_generator(language: LanguageEnum = LanguageEnum.english, role: RoleEnum | None = None) -> PromptGenerator:
+    """Shared PromptGenerator per (language, role); the prompt never changes after init."""
+    return PromptGenerator(language, role)
@@ -3,6 +3,9 @@ from typing import Set, List
 import string
 import time
 
+# Monotonic: these timestamps only feed timeout math, so wall-clock jumps must not affect them
+_now = time.monotonic
+
 class RelevanceFilter:
     def __init__(self, conversation_timeout=30.0):
         # Core food and restaurant keywords
@@ -126,7 +129,7 @@ class RelevanceFilter:
         # Conversation state
         self.conversation_active = False
         self.conversation_timeout = conversation_timeout
-        self.last_relevant_speech_time = time.time()
+        self.last_relevant_speech_time = _now()
 
     def contains_wake_word(self, text: str) -> bool:
         """Check if text contains wake word"""
@@ -224,7 +227,7 @@ class RelevanceFilter:
         if self.contains_wake_word(text):
             score += 0.9
             self.conversation_active = True
-            self.last_relevant_speech_time = time.time()
+            self.last_relevant_speech_time = _now()
             return max(0.0, min(1.0, score))
         
         # Handle "I + person + food" pattern (first-person recommendations)
@@ -274,7 +277,7 @@ class RelevanceFilter:
 
     def should_process_speech(self, text: str, recent_messages: List[str] = None) -> bool:
         """Main decision function - determines if speech should be processed"""
-        current_time = time.time()
+        current_time = _now()
         dormant = False
         # Check for gibberish/noise first
         cleaned_text = self.clean_text(text)
@@ -341,12 +344,12 @@ class RelevanceFilter:
     def reset_conversation(self):
         """Manually reset conversation state"""
         self.conversation_active = False
-        self.last_relevant_speech_time = time.time()
+        self.last_relevant_speech_time = _now()
         print("[RESET] Conversation state reset")
 
     def get_conversation_status(self):
         """Get current conversation status for debugging"""
-        current_time = time.time()
+        current_time = _now()
         time_since_last = current_time - self.last_relevant_speech_time
         return {
             "active": self.conversation_active,
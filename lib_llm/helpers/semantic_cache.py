@@ -0,0 +1,90 @@
+import logging
+import time
+from collections import deque
+from typing import Optional, Tuple
+
+import numpy as np
+
+from app.config import (
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_EMBEDDING_MODEL,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL_SECONDS,
+    SEMANTIC_CACHE_MAX_ENTRIES
+)
+from app.llm_provider import get_shared_async_llm_client
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    In-process cache of LLM replies keyed by prompt embedding.
+
+    A prompt whose embedding has cosine similarity >= threshold with a cached
+    prompt in the same namespace gets that prompt's reply. Namespaces keep
+    replies for different languages and roles apart.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl_seconds: float = SEMANTIC_CACHE_TTL_SECONDS,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        model: str = SEMANTIC_CACHE_EMBEDDING_MODEL
+    ):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.model = model
+        self.enabled = SEMANTIC_CACHE_ENABLED
+        # namespace -> deque of (unit embedding, reply, expires_at); oldest first
+        self._entries: dict[str, deque] = {}
+
+    async def _embed(self, text: str) -> np.ndarray:
+        # Looked up per call so importing the module never builds a client
+        client = get_shared_async_llm_client()
+        response = await client.embeddings.create(model=self.model, input=text)
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    async def get(self, namespace: str, text: str) -> Tuple[Optional[np.ndarray], Optional[str]]:
+        """
+        Look up a reply for the prompt.
+
+        Returns:
+            (key, reply): key is passed back to put() on a miss and is None when
+            the cache is disabled or the prompt could not be embedded; reply is
+            None on a miss.
+        """
+        if not self.enabled or not text.strip():
+            return None, None
+
+        try:
+            key = await self._embed(text)
+        except Exception as e:
+            logger.warning("[SemanticCache] Embedding failed, bypassing cache: %s", e)
+            return None, None
+
+        entries = self._entries.get(namespace)
+        if not entries:
+            return key, None
+
+        now = time.monotonic()
+        while entries and entries[0][2] <= now:
+            entries.popleft()
+        if not entries:
+            return key, None
+
+        similarities = np.stack([entry[0] for entry in entries]) @ key
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return key, entries[best][1]
+        return key, None
+
+    def put(self, namespace: str, key: Optional[np.ndarray], reply: str):
+        """Cache a reply under the key returned by get()."""
+        if key is None or not reply:
+            return
+        entries = self._entries.setdefault(namespace, deque(maxlen=self.max_entries))
+        entries.append((key, reply, time.monotonic() + self.ttl_seconds))
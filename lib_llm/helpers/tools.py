@@ -1,12 +1,11 @@
-import os
 import json
 import requests
 from collections import defaultdict
 import datetime
 import uuid
+from app.config import API_BASE_URL
 
 def call_api(path: str, method: str = "GET", headers: dict = None, data: dict = None, params: dict = None):
-    API_BASE_URL = os.getenv("API_BASE_URL")
     endpoint = f"{API_BASE_URL.rstrip('/')}/{path.lstrip('/')}"
     method = method.upper()
     headers = headers or {}
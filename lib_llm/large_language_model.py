@@ -163,7 +163,7 @@ class LargeLanguageModel:
         words = "".join(llm_words)
         print(f"[LLM] Response complete - Length: {len(words)} chars")
         if self.observer:
-            self.observer.log("llm", "response_complete", chars=len(words))
+            self.observer.log("llm", "response_complete", chars=len(words), **self.llm.usage_fields())
         asyncio.create_task(self._save_message("assistant", words))
         await self.dispatcher.broadcast(
             self.guid,
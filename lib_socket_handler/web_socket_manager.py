@@ -5,7 +5,9 @@ from lib_infrastructure.dispatcher import (
     MessageType,
 )
 
+import binascii
 import json
+import orjson
 from fastapi import WebSocket
 from fastapi.websockets import WebSocketState
 import asyncio , os
@@ -61,8 +63,14 @@ class WebsocketManager(Disposable):
         # send json data object to twillio websocket 
         # await self.ws.send_bytes(message)
         if isinstance(message , dict) : 
+            audio = message.get("audio")
+            if isinstance(audio, (bytes, bytearray)):
+                # TTS hands over raw audio; clients receive it base64 encoded inside the JSON frame
+                message = {**message, "audio": binascii.b2a_base64(audio, newline=False).decode("ascii")}
+            # orjson, decoded to a text frame: audio frames carry large base64 strings
+            frame = orjson.dumps(message).decode()
             async with self._send_lock:
-                await self.ws.send_json(message)
+                await self.ws.send_text(frame)
             if self.observer and message.get("audio"):
                 self.observer.mark("first_audio_out")
                 self.observer.log(
@@ -1,4 +1,5 @@
 import json
+import orjson
 import asyncio
 import contextlib
 from functools import partial
@@ -31,48 +32,32 @@ class SpeechToTextDeepgram :
         self.dg_connection = self.deepgram.listen.live.v("1")
         self._loop = None
 
+        # smart_format stays on: final transcripts are also shown to the user
+        # (is_transcription frames), and it formats their numbers and dates
+        deepgram_options = dict(
+            smart_format=True,
+            model="nova-2-general",
+            punctuate=True,
+            language=self.language,
+            channels=1,
+            interim_results=True,
+            utterance_end_ms=1000,
+            vad_events=True,
+        )
+
         # Configure Deepgram based on source type
         if source == "phone":
             # Raw PCM streaming from Python clients, mobile apps
             # Expects linear16 (16-bit signed PCM) @ 16kHz mono
-            self.deepgram_options = LiveOptions(
-                smart_format=True,
-                model="nova-2-general",
-                punctuate=True,
-                language=self.language,
-                encoding="linear16",
-                sample_rate=16000,
-                channels=1,
-                interim_results=True,
-                utterance_end_ms=1000,
-                vad_events=True,
-            )
+            self.deepgram_options = LiveOptions(**deepgram_options, encoding="linear16", sample_rate=16000)
             print(f"[STT] Configured for raw PCM (phone source)")
         elif source == "web":
             # Browser MediaRecorder sends WebM/Opus - Deepgram auto-detects
-            self.deepgram_options = LiveOptions(
-                smart_format=True,
-                model="nova-2-general",
-                punctuate=True,
-                language=self.language,
-                channels=1,
-                interim_results=True,
-                utterance_end_ms=1000,
-                vad_events=True,
-            )
+            self.deepgram_options = LiveOptions(**deepgram_options)
             print(f"[STT] Configured for browser audio (web source - auto-detect)")
         else:
             # device source - text-based, but set default options anyway
-            self.deepgram_options = LiveOptions(
-                smart_format=True,
-                model="nova-2-general",
-                punctuate=True,
-                language=self.language,
-                channels=1,
-                interim_results=True,
-                utterance_end_ms=1000,
-                vad_events=True,
-            )    
+            self.deepgram_options = LiveOptions(**deepgram_options)
 
 
 
@@ -80,7 +65,7 @@ class SpeechToTextDeepgram :
         try:
             if text is None:
                 return
-            sentence = json.loads(text)
+            sentence = orjson.loads(text)
             sentence = sentence.get("transcibed_text" , None)
             if sentence is not None:
                 if self.observer:
@@ -0,0 +1,15 @@
+import orjson
+
+
+def dumps_text(payload) -> str:
+    # TTS providers expect text frames, so the orjson bytes are decoded before sending.
+    return orjson.dumps(payload).decode()
+
+
+def count_new_words(buffer: str, word: str) -> int:
+    """Words ``word`` adds to ``buffer``, matching ``len(buffer.split())`` without rescanning it."""
+    count = len(word.split())
+    # A token glued onto an unfinished word (e.g. "hel" + "lo") extends it rather than starting a new one.
+    if count and buffer and not buffer[-1].isspace() and not word[0].isspace():
+        count -= 1
+    return count
@@ -1,16 +1,20 @@
 import asyncio
 import base64
+import logging
 from functools import partial
 from lib_infrastructure.dispatcher import (
     Dispatcher, Message,
     MessageHeader, MessageType,
 )
+from lib_tts.helpers.text_utils import count_new_words
 from deepgram import (
     DeepgramClient,
     SpeakWSOptions,
     SpeakWebSocketEvents,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class TextToSpeechDeepgram:
     """
@@ -40,6 +44,7 @@ class TextToSpeechDeepgram:
         # Smart buffering
         self.use_smart_buffering = True
         self.word_buffer = ""
+        self._buffer_word_count = 0
         self.buffer_timer = None
         self.buffer_lock = asyncio.Lock()
         self.min_buffer_size = 5
@@ -189,7 +194,7 @@ class TextToSpeechDeepgram:
                         ),
                     )
                 )
-            print(f"🎵 Deepgram audio chunk: {len(data)} bytes")
+            logger.debug("Deepgram audio chunk %d bytes", len(data))
         except Exception as e:
             print(f"❌ Error broadcasting audio: {e}")
 
@@ -257,7 +262,7 @@ class TextToSpeechDeepgram:
         try:
             clean_text = text.replace('*', '').strip()
             self.dg_connection.send_text(clean_text)
-            print(f"📤 Sent to Deepgram: '{clean_text[:30]}...' ({len(clean_text)} chars)")
+            logger.debug("sent to Deepgram: %.30s (%d chars)", clean_text, len(clean_text))
         except Exception as e:
             print(f"❌ Error sending to Deepgram: {e}")
             self.is_connected = False
@@ -272,8 +277,9 @@ class TextToSpeechDeepgram:
             return
 
         async with self.buffer_lock:
+            self._buffer_word_count += count_new_words(self.word_buffer, word)
             self.word_buffer += word
-            word_count = len(self.word_buffer.split())
+            word_count = self._buffer_word_count
 
             should_send = False
             reason = ""
@@ -299,6 +305,7 @@ class TextToSpeechDeepgram:
             
         if self.is_interrupted:
             self.word_buffer = ""
+            self._buffer_word_count = 0
             return
 
         self.is_flushing = True
@@ -306,12 +313,13 @@ class TextToSpeechDeepgram:
         try:
             buffer_content = self.word_buffer.strip()
             self.word_buffer = ""
+            self._buffer_word_count = 0
 
             if self.buffer_timer:
                 self.buffer_timer.cancel()
                 self.buffer_timer = None
 
-            print(f"🎵 Flushing ({reason}): '{buffer_content[:40]}...'")
+            logger.debug("flushing (%s): %.40s", reason, buffer_content)
             await self.send_text(buffer_content)
 
         finally:
@@ -400,6 +408,7 @@ class TextToSpeechDeepgram:
 
                 async with self.buffer_lock:
                     self.word_buffer = ""
+                    self._buffer_word_count = 0
                 
                 if self.buffer_timer:
                     self.buffer_timer.cancel()
@@ -430,14 +439,14 @@ class TextToSpeechDeepgram:
         await self.connect()
         
         try:
-            await asyncio.gather(
-                self.handle_llm_generated_text(),
-                self.handle_tts_flush(),
-                self.handle_user_interruption(),
-            )
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self.handle_user_interruption(), name=f"tts-interrupt-{self.guid[:8]}")
+                group.create_task(self.handle_llm_generated_text(), name=f"tts-text-{self.guid[:8]}")
+                group.create_task(self.handle_tts_flush(), name=f"tts-flush-{self.guid[:8]}")
         except asyncio.CancelledError:
             print("🛑 Deepgram TTS cancelled")
-        except Exception as e:
+        except ExceptionGroup as eg:
+            e = eg.exceptions[0]
             print(f"❌ Deepgram TTS error: {e}")
             import traceback
             traceback.print_exc()
@@ -1,13 +1,21 @@
 import asyncio
 import base64
 import json
+import logging
 import re
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed
 from lib_infrastructure.dispatcher import (
     Dispatcher, Message,
     MessageHeader, MessageType,
 )
+from lib_tts.helpers.text_utils import count_new_words, dumps_text
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_MSG = '{"text":"","flush":true}'
+
 
 class TextToSpeechElevenLabs:
     """
@@ -40,6 +48,7 @@ class TextToSpeechElevenLabs:
         # Smart buffering options
         self.use_smart_buffering = True
         self.word_buffer = ""
+        self._buffer_word_count = 0
         self.buffer_timer = None
         self.buffer_lock = asyncio.Lock()
         self.min_buffer_size = 5  # Increased for better audio quality
@@ -105,7 +114,7 @@ class TextToSpeechElevenLabs:
                     "xi_api_key": self.api_key,
                 }
                 
-                await self.websocket.send(json.dumps(init_message))
+                await self.websocket.send(dumps_text(init_message))
                 self.is_initialized = True
                 print(f"✅ ElevenLabs WebSocket connected and initialized")
                 
@@ -152,7 +161,7 @@ class TextToSpeechElevenLabs:
                     
                 try:
                     message = await asyncio.wait_for(self.websocket.recv(), timeout=30.0)
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     
                     # Check if we've been interrupted
                     if self.is_interrupted:
@@ -180,7 +189,7 @@ class TextToSpeechElevenLabs:
                                 data=data_object,
                             ),
                         )
-                        print(f"🎵 Audio chunk broadcasted")
+                        logger.debug("audio chunk broadcasted")
                         
                     if data.get('isFinal'):
                         if self._suppress_audio_complete:
@@ -252,8 +261,8 @@ class TextToSpeechElevenLabs:
             if flush:
                 message["flush"] = True
                 
-            await self.websocket.send(json.dumps(message))
-            print(f"📤 Sent: '{text.strip()[:30]}...' ({len(text.strip())} chars)")
+            await self.websocket.send(dumps_text(message))
+            logger.debug("sent: %.30s (%d chars)", message["text"], len(message["text"]))
             
         except ConnectionClosed:
             print("❌ WebSocket closed while sending - will reconnect")
@@ -274,8 +283,9 @@ class TextToSpeechElevenLabs:
             return
         
         async with self.buffer_lock:
+            self._buffer_word_count += count_new_words(self.word_buffer, word)
             self.word_buffer += word
-            word_count = len(self.word_buffer.split())
+            word_count = self._buffer_word_count
             
             should_send = False
             reason = ""
@@ -301,6 +311,7 @@ class TextToSpeechElevenLabs:
         
         if self.is_interrupted:
             self.word_buffer = ""
+            self._buffer_word_count = 0
             return
             
         self.is_flushing = True
@@ -308,12 +319,13 @@ class TextToSpeechElevenLabs:
         try:
             buffer_content = self.word_buffer.strip()
             self.word_buffer = ""
+            self._buffer_word_count = 0
             
             if self.buffer_timer:
                 self.buffer_timer.cancel()
                 self.buffer_timer = None
             
-            print(f"🎵 Flushing ({reason}): '{buffer_content[:40]}...'")
+            logger.debug("flushing (%s): %.40s", reason, buffer_content)
             await self.send_text(buffer_content)
             
         finally:
@@ -396,7 +408,7 @@ class TextToSpeechElevenLabs:
         if self.is_connected and self.websocket:
             try:
                 # Send empty string with flush to signal end of this generation
-                await self.websocket.send(json.dumps({"text": "", "flush": True}))
+                await self.websocket.send(_FLUSH_MSG)
                 print("🔚 Sent end signal to ElevenLabs")
                 # Give time for audio to be generated and sent
                 await asyncio.sleep(0.3)
@@ -423,6 +435,7 @@ class TextToSpeechElevenLabs:
 
         async with self.buffer_lock:
             self.word_buffer = ""
+            self._buffer_word_count = 0
 
         if self.buffer_timer:
             self.buffer_timer.cancel()
@@ -430,7 +443,7 @@ class TextToSpeechElevenLabs:
 
         if self.is_connected and self.websocket:
             try:
-                await self.websocket.send(json.dumps({"text": "", "flush": True}))
+                await self.websocket.send(_FLUSH_MSG)
                 print("🛑 Sent flush to interrupt ElevenLabs")
             except Exception as e:
                 print(f"❌ Error interrupting: {e}")
@@ -513,14 +526,14 @@ class TextToSpeechElevenLabs:
         await self.connect_websocket()
         
         try:
-            await asyncio.gather(
-                self.handle_llm_generated_text(),
-                self.handle_tts_flush(),
-                self.handle_user_interruption(),
-            )
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self.handle_user_interruption(), name=f"tts-interrupt-{self.guid[:8]}")
+                group.create_task(self.handle_llm_generated_text(), name=f"tts-text-{self.guid[:8]}")
+                group.create_task(self.handle_tts_flush(), name=f"tts-flush-{self.guid[:8]}")
         except asyncio.CancelledError:
             print("🛑 ElevenLabs TTS service cancelled")
-        except Exception as e:
+        except ExceptionGroup as eg:
+            e = eg.exceptions[0]
             print(f"❌ ElevenLabs TTS service error: {e}")
         finally:
             await self.close_connection()
@@ -1,8 +1,13 @@
 import asyncio
-import base64
-import json
+import binascii
+import logging
+import ssl
+import time
+from collections import deque
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed
+from websockets.protocol import State
 from lib_infrastructure.dispatcher import (
     Dispatcher,
     Message,
@@ -10,6 +15,71 @@ from lib_infrastructure.dispatcher import (
     MessageType,
 )
 from lib_infrastructure.helpers.realtime_observability import SessionObserver
+from lib_tts.helpers.text_utils import count_new_words, dumps_text
+
+logger = logging.getLogger(__name__)
+
+_loads = orjson.loads
+# Built once per process so reconnects don't reload the CA bundle.
+_SSL_CONTEXT = ssl.create_default_context()
+_TASK_FINISH_MSG = '{"event":"task_finish"}'
+# Bit n is set when chr(n) ends a sentence; code points outside the mask shift to 0.
+_SENTENCE_END_MASK = (1 << ord(".")) | (1 << ord("!")) | (1 << ord("?"))
+# Full-width terminators for the Cantonese/Mandarin voices; kept out of the mask so it stays small.
+_CJK_SENTENCE_ENDS = frozenset("。！？")
+
+
+class _MinimaxConnectionPool:
+    """Idle, already-handshaken Minimax sockets that later sessions can pick up instead of reconnecting.
+
+    Sockets are keyed by endpoint and API key: voice and model travel in each ``task_start``,
+    so any idle socket on the same account can serve any voice.
+    """
+
+    def __init__(self, max_idle: int = 8, idle_ttl: float = 60.0):
+        self.max_idle = max_idle
+        self.idle_ttl = idle_ttl
+        self._idle: dict[tuple, deque] = {}
+        self._idle_count = 0
+
+    async def acquire(self, key: tuple):
+        idle = self._idle.get(key)
+        now = time.monotonic()
+        while idle:
+            released_at, websocket = idle.pop()
+            self._idle_count -= 1
+            if now - released_at <= self.idle_ttl and websocket.state is State.OPEN:
+                return websocket
+            await _close_quietly(websocket)
+        return None
+
+    def release(self, key: tuple, websocket) -> bool:
+        if self._idle_count >= self.max_idle or websocket.state is not State.OPEN:
+            return False
+        self._idle.setdefault(key, deque()).append((time.monotonic(), websocket))
+        self._idle_count += 1
+        return True
+
+    async def close_all(self):
+        idle, self._idle, self._idle_count = self._idle, {}, 0
+        await asyncio.gather(
+            *(_close_quietly(websocket) for sockets in idle.values() for _, websocket in sockets)
+        )
+
+
+async def _close_quietly(websocket):
+    try:
+        await websocket.close()
+    except Exception:
+        pass
+
+
+_POOL = _MinimaxConnectionPool()
+
+
+async def close_pooled_connections():
+    """Close every idle pooled socket; called once at app shutdown."""
+    await _POOL.close_all()
 
 
 class TextToSpeechMinimax:
@@ -34,20 +104,29 @@ class TextToSpeechMinimax:
         self.voice_id = voice_id
         self.model = model
         self.uri = "wss://api.minimax.io/ws/v1/t2a_v2"
+        self._headers = {"Authorization": f"Bearer {self.api_key}"}
+        self._pool_key = (self.uri, self.api_key)
 
         self.websocket = None
         self.is_connected = False
+        self._connected_event = asyncio.Event()
         self.is_task_started = False
+        # Tasks started on this socket that the server has not yet reported finished or failed;
+        # counted because a new task_start can go out before the previous task_finished arrives
+        self._tasks_in_flight = 0
         self.task_started_event = None
         self.connection_lock = asyncio.Lock()
         self.interrupt_lock = asyncio.Lock()
 
         self.audio_listener_task = None
         self.buffer_timer = None
+        self._timer_flush_task = None
         self.buffer_lock = asyncio.Lock()
 
         self.use_smart_buffering = True
         self.word_buffer = ""
+        self._buffer_word_count = 0
+        self._buffer_has_nonspace = False
         self.min_buffer_size = 8
         self.max_buffer_time = 2.5
         self.is_flushing = False
@@ -58,6 +137,7 @@ class TextToSpeechMinimax:
         self._audio_end_sent = False
         self._last_audio_monotonic = None
         self._audio_end_fallback_task = None
+        self._audio_out_logged = False
 
         self.audio_settings = {
             "sample_rate": 16000,
@@ -72,6 +152,15 @@ class TextToSpeechMinimax:
             "pitch": 0,
             "english_normalization": False,
         }
+        # Settings are fixed per instance, so the task_start frame is serialized once.
+        self._task_start_msg = dumps_text(
+            {
+                "event": "task_start",
+                "model": self.model,
+                "voice_setting": self.voice_settings,
+                "audio_setting": self.audio_settings,
+            }
+        )
 
     async def connect_websocket(self):
         async with self.connection_lock:
@@ -86,21 +175,28 @@ class TextToSpeechMinimax:
                 self.websocket = None
 
             try:
-                headers = {"Authorization": f"Bearer {self.api_key}"}
-                self.websocket = await websockets.connect(
-                    self.uri,
-                    additional_headers=headers,
-                    ping_interval=20,
-                    ping_timeout=10,
-                    close_timeout=10,
-                )
+                self.websocket = await _POOL.acquire(self._pool_key)
+                if self.websocket is None:
+                    self.websocket = await websockets.connect(
+                        self.uri,
+                        additional_headers=self._headers,
+                        ssl=_SSL_CONTEXT,
+                        ping_interval=20,
+                        ping_timeout=10,
+                        close_timeout=10,
+                    )
 
-                response = json.loads(await asyncio.wait_for(self.websocket.recv(), timeout=10.0))
-                if response.get("event") != "connected_success":
-                    return False
+                    response = _loads(await asyncio.wait_for(self.websocket.recv(decode=False), timeout=10.0))
+                    if response.get("event") != "connected_success":
+                        return False
+                elif self.observer:
+                    self.observer.log("tts", "pooled_connection_reused")
 
                 self.is_connected = True
+                self._connected_event.set()
                 self.is_task_started = False
+                # Fresh and pooled sockets alike carry no unfinished task
+                self._tasks_in_flight = 0
                 self.task_started_event = asyncio.Event()
                 if self.observer:
                     self.observer.log("tts", "connected")
@@ -110,6 +206,7 @@ class TextToSpeechMinimax:
                 return True
             except Exception as e:
                 self.is_connected = False
+                self._connected_event.clear()
                 if self.observer:
                     self.observer.log("tts", "connect_error", error=str(e))
                 return False
@@ -131,19 +228,8 @@ class TextToSpeechMinimax:
         try:
             self.task_started_event = self.task_started_event or asyncio.Event()
             self.task_started_event.clear()
-            await asyncio.wait_for(
-                self.websocket.send(
-                    json.dumps(
-                        {
-                            "event": "task_start",
-                            "model": self.model,
-                            "voice_setting": self.voice_settings,
-                            "audio_setting": self.audio_settings,
-                        }
-                    )
-                ),
-                timeout=5.0,
-            )
+            self._tasks_in_flight += 1
+            await asyncio.wait_for(self.websocket.send(self._task_start_msg), timeout=5.0)
             await asyncio.wait_for(self.task_started_event.wait(), timeout=10.0)
             return True
         except Exception as e:
@@ -155,11 +241,12 @@ class TextToSpeechMinimax:
         while True:
             try:
                 if not self.is_connected or not self.websocket:
-                    await asyncio.sleep(0.1)
+                    await self._connected_event.wait()
                     continue
 
-                message = await asyncio.wait_for(self.websocket.recv(), timeout=30.0)
-                response = json.loads(message)
+                # Dead connections surface as ConnectionClosed via the keepalive pings set in connect_websocket.
+                message = await self.websocket.recv(decode=False)
+                response = _loads(message)
                 event_type = response.get("event")
 
                 if event_type == "task_started":
@@ -169,8 +256,13 @@ class TextToSpeechMinimax:
                         self.task_started_event.set()
                     continue
 
+                if event_type == "task_finished":
+                    self._tasks_in_flight = max(self._tasks_in_flight - 1, 0)
+                    continue
+
                 if event_type == "task_failed":
                     self.is_task_started = False
+                    self._tasks_in_flight = max(self._tasks_in_flight - 1, 0)
                     if self.observer:
                         self.observer.log("tts", "task_failed", payload=str(response)[:200])
                     continue
@@ -181,11 +273,13 @@ class TextToSpeechMinimax:
                 audio_hex = response.get("data", {}).get("audio")
                 if audio_hex:
                     self._last_audio_monotonic = asyncio.get_running_loop().time()
-                    audio_bytes = bytes.fromhex(audio_hex)
-                    base64_audio = base64.b64encode(audio_bytes).decode("utf-8")
+                    # Minimax streams hex only; the websocket edge base64-encodes the raw bytes for the client.
+                    # Each chunk gets its own bytes object: it sits in the dispatcher mailbox until the websocket
+                    # task sends it, so decoding into a reused buffer would overwrite chunks still queued.
+                    audio_bytes = binascii.a2b_hex(audio_hex)
 
                     if self.voice_tracker:
-                        allowed = await self.voice_tracker.track_audio_chunk(base64_audio)
+                        allowed = await self.voice_tracker.track_audio_chunk(audio_bytes)
                         if not allowed:
                             await self._interrupt_generation()
                             continue
@@ -194,10 +288,13 @@ class TextToSpeechMinimax:
                         self.guid,
                         Message(
                             MessageHeader(MessageType.CALL_WEBSOCKET_PUT),
-                            data={"is_text": False, "audio": base64_audio},
+                            data={"is_text": False, "audio": audio_bytes},
                         ),
                     )
-                    if self.observer:
+                    logger.debug("audio chunk %d bytes", len(audio_bytes))
+                    if self.observer and not self._audio_out_logged:
+                        # Only the first chunk carries the latency figure; later ones would just flood stdout.
+                        self._audio_out_logged = True
                         self.observer.mark("first_audio_out")
                         self.observer.log(
                             "tts",
@@ -218,15 +315,9 @@ class TextToSpeechMinimax:
                         continue
                     if self._awaiting_audio_end and not self.is_interrupted:
                         await self._broadcast_audio_end()
-            except asyncio.TimeoutError:
-                if self.websocket and self.is_connected:
-                    try:
-                        await self.websocket.ping()
-                    except Exception:
-                        self.is_connected = False
-                continue
             except ConnectionClosed:
                 self.is_connected = False
+                self._connected_event.clear()
                 self.is_task_started = False
                 if self.observer:
                     self.observer.log("tts", "connection_closed")
@@ -253,23 +344,40 @@ class TextToSpeechMinimax:
 
         clean_text = text.replace("*", "").strip()
         await asyncio.wait_for(
-            self.websocket.send(json.dumps({"event": "task_continue", "text": clean_text})),
+            self.websocket.send(dumps_text({"event": "task_continue", "text": clean_text})),
             timeout=5.0,
         )
         if self.observer:
             self.observer.log("tts", "text_sent", chars=len(clean_text))
 
     async def add_word_to_buffer(self, word: str):
-        if self.is_interrupted:
+        if self.is_interrupted or not word:
+            return
+        # Whitespace only matters as a separator; leading or repeated whitespace is stripped before sending anyway.
+        if word.isspace() and (not self.word_buffer or self.word_buffer[-1].isspace()):
             return
 
         if not self.use_smart_buffering:
             await self.send_text(word)
             return
 
+        if not self.word_buffer and not self._is_sentence_end(word):
+            # Nothing to merge or emit: no await separates this check from the update, so no lock is needed.
+            new_words = len(word.split())
+            if new_words < self.min_buffer_size:
+                self.word_buffer = word
+                self._buffer_word_count = new_words
+                self._buffer_has_nonspace = bool(new_words)
+                self._schedule_buffer_flush()
+                return
+
         async with self.buffer_lock:
+            new_words = count_new_words(self.word_buffer, word)
+            if new_words:
+                self._buffer_word_count += new_words
+                self._buffer_has_nonspace = True
             self.word_buffer += word
-            word_count = len(self.word_buffer.split())
+            word_count = self._buffer_word_count
 
             should_send = False
             reason = ""
@@ -286,16 +394,16 @@ class TextToSpeechMinimax:
                 self._schedule_buffer_flush()
 
     async def _flush_buffer_internal(self, reason: str = ""):
-        if self.is_flushing or not self.word_buffer.strip():
+        if self.is_flushing or not self._buffer_has_nonspace:
             return
         if self.is_interrupted:
-            self.word_buffer = ""
+            self._reset_buffer()
             return
 
         self.is_flushing = True
         try:
             buffer_content = self.word_buffer.strip()
-            self.word_buffer = ""
+            self._reset_buffer()
             if self.buffer_timer:
                 self.buffer_timer.cancel()
                 self.buffer_timer = None
@@ -313,17 +421,25 @@ class TextToSpeechMinimax:
         if self.buffer_timer:
             self.buffer_timer.cancel()
 
-        async def delayed_flush():
-            await asyncio.sleep(self.max_buffer_time)
-            if self.word_buffer.strip() and not self.is_interrupted and not self.is_flushing:
-                await self._flush_buffer("timer")
+        # A TimerHandle per token instead of a Task; a Task is only created if the timer actually fires.
+        self.buffer_timer = asyncio.get_running_loop().call_later(self.max_buffer_time, self._on_buffer_timer)
 
-        self.buffer_timer = asyncio.create_task(delayed_flush())
+    def _on_buffer_timer(self):
+        self.buffer_timer = None
+        if self._buffer_has_nonspace and not self.is_interrupted and not self.is_flushing:
+            self._timer_flush_task = asyncio.create_task(self._flush_buffer("timer"))
 
-    def _is_sentence_end(self, text: str) -> bool:
-        import re
+    def _reset_buffer(self):
+        self.word_buffer = ""
+        self._buffer_word_count = 0
+        self._buffer_has_nonspace = False
 
-        return bool(re.search(r"[.!?]\s*$", text.strip()))
+    def _is_sentence_end(self, text: str) -> bool:
+        tail = text.rstrip()
+        if not tail:
+            return False
+        last = tail[-1]
+        return bool(_SENTENCE_END_MASK >> ord(last) & 1) or last in _CJK_SENTENCE_ENDS
 
     async def _broadcast_audio_end(self):
         if self._audio_end_sent:
@@ -349,10 +465,11 @@ class TextToSpeechMinimax:
             self._audio_end_fallback_task.cancel()
 
         async def _runner():
-            started = asyncio.get_running_loop().time()
+            loop = asyncio.get_running_loop()
+            started = loop.time()
             try:
                 while self._awaiting_audio_end and not self.is_interrupted and not self._audio_end_sent:
-                    now = asyncio.get_running_loop().time()
+                    now = loop.time()
                     if self._last_audio_monotonic is not None and (now - self._last_audio_monotonic) >= idle_wait:
                         print("⏱️ audio_is_end fallback triggered from idle timeout")
                         await self._broadcast_audio_end()
@@ -361,7 +478,11 @@ class TextToSpeechMinimax:
                         print("⏱️ audio_is_end fallback triggered from hard timeout")
                         await self._broadcast_audio_end()
                         return
-                    await asyncio.sleep(0.1)
+                    # Sleep until the nearer deadline; new audio pushes the idle one out and is re-checked on wake.
+                    deadline = started + max_wait
+                    if self._last_audio_monotonic is not None:
+                        deadline = min(deadline, self._last_audio_monotonic + idle_wait)
+                    await asyncio.sleep(max(deadline - now, 0.01))
             except asyncio.CancelledError:
                 return
 
@@ -369,7 +490,7 @@ class TextToSpeechMinimax:
 
     async def flush_and_end(self):
         async with self.buffer_lock:
-            if self.word_buffer.strip() and not self.is_interrupted:
+            if self._buffer_has_nonspace and not self.is_interrupted:
                 await self._flush_buffer_internal("final")
 
         if not self._reply_active:
@@ -380,7 +501,7 @@ class TextToSpeechMinimax:
         if self.is_connected and self.websocket and self.is_task_started:
             try:
                 await asyncio.wait_for(
-                    self.websocket.send(json.dumps({"event": "task_finish"})), timeout=3.0
+                    self.websocket.send(_TASK_FINISH_MSG), timeout=3.0
                 )
                 self.is_task_started = False
                 if self.task_started_event:
@@ -394,7 +515,7 @@ class TextToSpeechMinimax:
 
     async def _interrupt_generation(self, send_clear_event: bool = True):
         async with self.interrupt_lock:
-            has_active_reply = self._reply_active or bool(self.word_buffer.strip()) or (
+            has_active_reply = self._reply_active or self._buffer_has_nonspace or (
                 self.is_connected and self.is_task_started
             )
             if not has_active_reply:
@@ -407,7 +528,7 @@ class TextToSpeechMinimax:
             self._audio_end_sent = False
             self._last_audio_monotonic = None
             async with self.buffer_lock:
-                self.word_buffer = ""
+                self._reset_buffer()
 
             if self.buffer_timer:
                 self.buffer_timer.cancel()
@@ -419,7 +540,7 @@ class TextToSpeechMinimax:
             if self.is_connected and self.websocket and self.is_task_started:
                 try:
                     await asyncio.wait_for(
-                        self.websocket.send(json.dumps({"event": "task_finish"})), timeout=3.0
+                        self.websocket.send(_TASK_FINISH_MSG), timeout=3.0
                     )
                     self.is_task_started = False
                     if self.task_started_event:
@@ -446,13 +567,17 @@ class TextToSpeechMinimax:
                 pass
 
         if self.websocket:
-            try:
-                await self.websocket.close()
-            except Exception:
-                pass
+            # Only a socket whose last task has finished server-side is handed on; otherwise its
+            # late audio and task_finished frames would be read by the next session.
+            idle = self.is_connected and not self._tasks_in_flight
+            if not (idle and _POOL.release(self._pool_key, self.websocket)):
+                await _close_quietly(self.websocket)
+            self.websocket = None
 
         self.is_connected = False
+        self._connected_event.clear()
         self.is_task_started = False
+        self._tasks_in_flight = 0
         if self.buffer_timer:
             self.buffer_timer.cancel()
             self.buffer_timer = None
@@ -494,16 +619,17 @@ class TextToSpeechMinimax:
         await self.connect_websocket()
 
         try:
-            await asyncio.gather(
-                self.handle_llm_generated_text(),
-                self.handle_tts_flush(),
-                self.handle_user_interruption(),
-            )
+            async with asyncio.TaskGroup() as group:
+                # Interruption first: it subscribes and gets scheduled ahead of text ingestion.
+                group.create_task(self.handle_user_interruption(), name=f"tts-interrupt-{self.guid[:8]}")
+                group.create_task(self.handle_llm_generated_text(), name=f"tts-text-{self.guid[:8]}")
+                group.create_task(self.handle_tts_flush(), name=f"tts-flush-{self.guid[:8]}")
         except asyncio.CancelledError:
             pass
-        except Exception as e:
+        except ExceptionGroup as eg:
+            error = eg.exceptions[0]
             if self.observer:
-                self.observer.log("tts", "fatal_error", error=str(e))
-            raise
+                self.observer.log("tts", "fatal_error", error=str(error))
+            raise error
         finally:
             await self.close_connection()
@@ -6,11 +6,12 @@ enforcing session, daily, and monthly limits.
 """
 
 from lib_voice_usage.voice_usage_tracker import VoiceUsageTracker, VoiceUsageInterceptor
-from lib_voice_usage.abuse_detector import VoiceAbuseDetector, AbuseDetectorIntegration
+from lib_voice_usage.abuse_detector import VoiceAbuseDetector, AbuseDetectorIntegration, start_abuse_event_writer
 
 __all__ = [
     'VoiceUsageTracker',
     'VoiceUsageInterceptor',
     'VoiceAbuseDetector',
-    'AbuseDetectorIntegration'
+    'AbuseDetectorIntegration',
+    'start_abuse_event_writer'
 ]
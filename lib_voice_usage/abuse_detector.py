@@ -8,7 +8,8 @@ Detects suspicious patterns in voice usage that may indicate abuse:
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import logging
+import time
 from typing import Optional
 
 from lib_database.database import Database
@@ -21,6 +22,55 @@ from app.config import (
     VOICE_ABUSE_RECONNECT_WINDOW_SECONDS
 )
 
+logger = logging.getLogger(__name__)
+
+# Abuse events are rare and best-effort, so one background writer absorbs their DB latency.
+# None until start_abuse_event_writer() runs and after stop_abuse_event_writer(); events are then
+# written inline, as they are when the queue is full.
+_abuse_event_queue: Optional[asyncio.Queue] = None
+_ABUSE_EVENT_QUEUE_SIZE = 1000
+
+
+def start_abuse_event_writer() -> asyncio.Task:
+    """
+    Start the background task that writes queued abuse events to the database.
+
+    Returns:
+        The writer task; pass it to stop_abuse_event_writer() on shutdown.
+    """
+    global _abuse_event_queue
+    _abuse_event_queue = asyncio.Queue(maxsize=_ABUSE_EVENT_QUEUE_SIZE)
+    return asyncio.create_task(_write_abuse_events(_abuse_event_queue))
+
+
+async def stop_abuse_event_writer(writer: asyncio.Task, timeout: float = 5.0):
+    """
+    Write out the queued abuse events, then stop the writer task.
+
+    Args:
+        writer: The task returned by start_abuse_event_writer()
+        timeout: Seconds to wait for the queue to drain before giving up
+    """
+    global _abuse_event_queue
+    queue, _abuse_event_queue = _abuse_event_queue, None
+    if queue is not None:
+        try:
+            await asyncio.wait_for(queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("[AbuseDetector] Dropping %d unwritten abuse events at shutdown", queue.qsize())
+    writer.cancel()
+
+
+async def _write_abuse_events(queue: asyncio.Queue):
+    while True:
+        repository, event = await queue.get()
+        try:
+            await repository.record_abuse_event(**event)
+        except Exception as e:
+            logger.error("[AbuseDetector] Error recording event: %s", e)
+        finally:
+            queue.task_done()
+
 
 class VoiceAbuseDetector:
     """
@@ -36,7 +86,8 @@ class VoiceAbuseDetector:
         self,
         user_id: str,
         session_id: str,
-        database: Database
+        database: Database,
+        repository: Optional[VoiceUsageRepository] = None
     ):
         """
         Initialize the abuse detector.
@@ -45,21 +96,22 @@ class VoiceAbuseDetector:
             user_id: User identifier
             session_id: Current session GUID
             database: Database instance
+            repository: Shared repository; a new one is created if not given
         """
         self.user_id = user_id
         self.session_id = session_id
         self.database = database
-        self.repository = VoiceUsageRepository(database)
+        self.repository = repository or VoiceUsageRepository(database)
 
         # Thresholds
         self.continuous_threshold_ms = VOICE_ABUSE_CONTINUOUS_THRESHOLD_MINUTES * 60 * 1000
         self.reconnect_threshold = VOICE_ABUSE_RECONNECT_THRESHOLD
         self.reconnect_window = VOICE_ABUSE_RECONNECT_WINDOW_SECONDS
 
-        # Tracking state
-        self.session_start = datetime.utcnow()
-        self.continuous_use_start: Optional[datetime] = None
-        self.last_activity: Optional[datetime] = None
+        # Tracking state (time.monotonic_ns() readings, kept as ints for the per-chunk path)
+        self.session_start = time.monotonic_ns()
+        self.continuous_use_start: Optional[int] = None
+        self.last_activity: Optional[int] = None
         self.total_continuous_ms = 0
 
         # Enabled flag
@@ -76,10 +128,12 @@ class VoiceAbuseDetector:
             return True
 
         try:
-            # Check for rapid reconnection pattern
+            # Check for rapid reconnection pattern; this session is left out so the
+            # count doesn't depend on whether its record has been written yet
             recent_sessions = await self.repository.get_recent_session_count(
                 self.user_id,
-                self.reconnect_window
+                self.reconnect_window,
+                exclude_session_id=self.session_id
             )
 
             if recent_sessions >= self.reconnect_threshold:
@@ -92,13 +146,13 @@ class VoiceAbuseDetector:
                         "message": f"User started {recent_sessions} sessions in {self.reconnect_window}s window"
                     }
                 )
-                print(f"[AbuseDetector] RAPID_RECONNECTION detected for user {self.user_id[:8]}...")
+                logger.warning("[AbuseDetector] RAPID_RECONNECTION detected for user %s...", self.user_id[:8])
                 return False
 
             return True
 
         except Exception as e:
-            print(f"[AbuseDetector] Error checking connection: {e}")
+            logger.error("[AbuseDetector] Error checking connection: %s", e)
             return True  # Allow on error
 
     async def track_activity(self, duration_ms: int):
@@ -111,10 +165,10 @@ class VoiceAbuseDetector:
         if not self.enabled:
             return
 
-        now = datetime.utcnow()
+        now = time.monotonic_ns()
 
         # Check if this is continuous activity (within 5 seconds of last activity)
-        if self.last_activity and (now - self.last_activity).total_seconds() < 5:
+        if self.last_activity is not None and now - self.last_activity < 5_000_000_000:
             # Continuous use - add to continuous counter
             self.total_continuous_ms += duration_ms
 
@@ -125,11 +179,11 @@ class VoiceAbuseDetector:
                     {
                         "continuous_duration_ms": self.total_continuous_ms,
                         "threshold_ms": self.continuous_threshold_ms,
-                        "session_duration_seconds": (now - self.session_start).total_seconds(),
+                        "session_duration_seconds": (now - self.session_start) / 1e9,
                         "message": f"Continuous voice use for {self.total_continuous_ms/60000:.1f} minutes"
                     }
                 )
-                print(f"[AbuseDetector] EXCESSIVE_CONTINUOUS_USE detected for user {self.user_id[:8]}...")
+                logger.warning("[AbuseDetector] EXCESSIVE_CONTINUOUS_USE detected for user %s...", self.user_id[:8])
                 # Reset to avoid repeated alerts
                 self.total_continuous_ms = 0
         else:
@@ -146,8 +200,7 @@ class VoiceAbuseDetector:
         if not self.enabled:
             return
 
-        now = datetime.utcnow()
-        session_duration = (now - self.session_start).total_seconds()
+        session_duration = (time.monotonic_ns() - self.session_start) / 1e9
 
         # Check for abnormally long session (e.g., > 2 hours without breaks)
         long_session_threshold_hours = 2
@@ -171,7 +224,7 @@ class VoiceAbuseDetector:
                                 "message": f"Session lasted {session_duration/3600:.1f} hours with {avg_activity_rate*100:.0f}% voice activity"
                             }
                         )
-                        print(f"[AbuseDetector] LONG_SESSION_NO_BREAKS detected for user {self.user_id[:8]}...")
+                        logger.warning("[AbuseDetector] LONG_SESSION_NO_BREAKS detected for user %s...", self.user_id[:8])
 
     async def _record_abuse_event(
         self,
@@ -181,19 +234,30 @@ class VoiceAbuseDetector:
         """
         Record an abuse event to the database.
 
+        Queued for the background writer when it is running, so the caller
+        never waits on the database; written inline when the queue is full.
+
         Args:
             event_type: Type of abuse detected
             details: Details about the event
         """
+        event = {
+            "user_id": self.user_id,
+            "session_id": self.session_id,
+            "event_type": event_type,
+            "details": details
+        }
+        if _abuse_event_queue is not None:
+            try:
+                _abuse_event_queue.put_nowait((self.repository, event))
+                return
+            except asyncio.QueueFull:
+                pass
+
         try:
-            await self.repository.record_abuse_event(
-                user_id=self.user_id,
-                session_id=self.session_id,
-                event_type=event_type,
-                details=details
-            )
+            await self.repository.record_abuse_event(**event)
         except Exception as e:
-            print(f"[AbuseDetector] Error recording event: {e}")
+            logger.error("[AbuseDetector] Error recording event: %s", e)
 
 
 class AbuseDetectorIntegration:
@@ -7,6 +7,9 @@ Integrates with the dispatcher system to intercept audio chunks and enforce limi
 
 import asyncio
 import base64
+import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional, Callable, Awaitable
 
@@ -15,6 +18,7 @@ from lib_infrastructure.dispatcher import (
 )
 from lib_database.database import Database
 from lib_database.voice_usage_repository import VoiceUsageRepository
+from lib_voice_usage.abuse_detector import VoiceAbuseDetector
 from lib_database.voice_usage_models import (
     VoiceLimitType,
     UserVoiceUsageSummary
@@ -28,6 +32,20 @@ from app.config import (
     AUDIO_BYTES_PER_MS
 )
 
+logger = logging.getLogger(__name__)
+
+# Headers for the events this module broadcasts, shared rather than built per message.
+# Their creation time is import time, so elapsed() is not meaningful on them.
+_WARNING_HEADER = MessageHeader(MessageType.VOICE_USAGE_WARNING)
+_LIMIT_REACHED_HEADER = MessageHeader(MessageType.VOICE_LIMIT_REACHED)
+
+# For 16kHz, 16-bit mono PCM: 32 bytes = 1ms
+_BYTES_PER_MS = AUDIO_BYTES_PER_MS if AUDIO_BYTES_PER_MS > 0 else 32
+# Power-of-two rates (the default 32) divide with a right shift
+_BYTES_PER_MS_SHIFT = (
+    _BYTES_PER_MS.bit_length() - 1 if _BYTES_PER_MS & (_BYTES_PER_MS - 1) == 0 else None
+)
+
 
 class VoiceUsageTracker:
     """
@@ -40,12 +58,56 @@ class VoiceUsageTracker:
     4. Stops TTS and notifies client when limits are reached
     """
 
+    # Usage is buffered in memory and written in batches
+    FLUSH_INTERVAL_SECONDS = 0.5
+    FLUSH_THRESHOLD_MS = 5000
+
+    LIMIT_MINUTES = {
+        VoiceLimitType.SESSION: VOICE_LIMIT_SESSION_MINUTES,
+        VoiceLimitType.DAILY: VOICE_LIMIT_DAILY_MINUTES,
+        VoiceLimitType.MONTHLY: VOICE_LIMIT_MONTHLY_MINUTES
+    }
+
+    # Limits are fixed at startup, so the client-facing messages are too
+    LIMIT_MESSAGES = {
+        VoiceLimitType.SESSION: f"You've reached your session voice limit of {VOICE_LIMIT_SESSION_MINUTES} minutes. Voice responses are now disabled, but text chat continues to work.",
+        VoiceLimitType.DAILY: f"You've reached your daily voice limit of {VOICE_LIMIT_DAILY_MINUTES} minutes. Voice will be available again tomorrow. Text chat continues to work.",
+        VoiceLimitType.MONTHLY: f"You've reached your monthly voice limit of {VOICE_LIMIT_MONTHLY_MINUTES} minutes. Voice will be available next month. Text chat continues to work."
+    }
+
+    # Counter attribute holding the usage measured against each limit
+    USAGE_ATTRIBUTES = {
+        VoiceLimitType.SESSION: "session_duration_ms",
+        VoiceLimitType.DAILY: "daily_duration_ms",
+        VoiceLimitType.MONTHLY: "monthly_duration_ms"
+    }
+
+    # Day and month totals left by each user's last session in this process, so a
+    # quick reconnect can start audio before the database answers
+    RECENT_USAGE_TTL_SECONDS = 30
+    RECENT_USAGE_MAX_USERS = 10000
+    _recent_usage: "OrderedDict[str, tuple[float, str, int, int]]" = OrderedDict()
+
+    # Everything but user_id is the same for every unlimited summary
+    UNLIMITED_SUMMARY_FIELDS = {
+        "session_duration_ms": 0,
+        "daily_duration_ms": 0,
+        "monthly_duration_ms": 0,
+        "session_limit_ms": float('inf'),
+        "daily_limit_ms": float('inf'),
+        "monthly_limit_ms": float('inf'),
+        "voice_enabled": True,
+        "limit_reached": None
+    }
+
     def __init__(
         self,
         guid: str,
         user_id: str,
         dispatcher: Dispatcher,
-        database: Database
+        database: Database,
+        repository: Optional[VoiceUsageRepository] = None,
+        abuse_detector_factory: Optional[Callable[[str, str], VoiceAbuseDetector]] = None
     ):
         """
         Initialize the voice usage tracker.
@@ -55,12 +117,16 @@ class VoiceUsageTracker:
             user_id: User identifier
             dispatcher: Dispatcher instance for event handling
             database: Database instance for persistence
+            repository: Shared repository; a new one is created if not given
+            abuse_detector_factory: Builds the detector from (user_id, session_id);
+                defaults to a detector on this tracker's repository
         """
         self.guid = guid
         self.user_id = user_id
         self.dispatcher = dispatcher
         self.database = database
-        self.repository = VoiceUsageRepository(database)
+        self.repository = repository or VoiceUsageRepository(database)
+        self._abuse_detector_factory = abuse_detector_factory
 
         # State tracking
         self.voice_enabled = True
@@ -83,22 +149,49 @@ class VoiceUsageTracker:
         self._session_warning_sent = False
         self._daily_warning_sent = False
         self._monthly_warning_sent = False
+        self._all_warnings_sent = False
 
-        # Lock for thread-safe updates
-        self._lock = asyncio.Lock()
+        # Set once the limit-reached events have been sent
+        self._limit_handled = False
+
+        # Set by the first end_session() call; later calls are no-ops
+        self._session_ended = False
+
+        # Set when initialize() finishes; audio waits for it so limits are known
+        self.usage_ready = asyncio.Event()
+
+        # Usage not yet written to the database
+        self._pending_ms = 0
+        self._pending_chunks = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Single writer per session; later batches wait for it instead of spawning tasks
+        self._flush_task: Optional[asyncio.Task] = None
 
         # Enabled flag
         self.enabled = VOICE_USAGE_ENABLED
 
-        # Abuse detection (lazy loaded)
+        # Abuse detection (created in initialize)
         self._abuse_detector = None
         self._abuse_detection_enabled = VOICE_ABUSE_DETECTION_ENABLED
 
+        # Usage summary built once; only the changing fields are refreshed on read
+        self._usage_summary = {
+            "user_id": self.user_id,
+            "session_id": self.guid,
+            "voice_enabled": True,
+            "limit_reached": None,
+            "session": {"used_ms": 0, "limit_ms": self.session_limit_ms, "remaining_ms": self.session_limit_ms},
+            "daily": {"used_ms": 0, "limit_ms": self.daily_limit_ms, "remaining_ms": self.daily_limit_ms},
+            "monthly": {"used_ms": 0, "limit_ms": self.monthly_limit_ms, "remaining_ms": self.monthly_limit_ms}
+        }
+
     async def initialize(self) -> UserVoiceUsageSummary:
         """
         Initialize the tracker by loading current usage from database.
         Creates session record and loads daily/monthly usage.
 
+        Can run in the background; track_audio_chunk waits for it to finish.
+
         Returns:
             UserVoiceUsageSummary with current state
         """
@@ -108,61 +201,98 @@ class VoiceUsageTracker:
         try:
             # Initialize abuse detector if enabled
             if self._abuse_detection_enabled:
-                from lib_voice_usage.abuse_detector import VoiceAbuseDetector
-                self._abuse_detector = VoiceAbuseDetector(
-                    self.user_id,
-                    self.guid,
-                    self.database
+                if self._abuse_detector_factory:
+                    self._abuse_detector = self._abuse_detector_factory(self.user_id, self.guid)
+                else:
+                    self._abuse_detector = VoiceAbuseDetector(
+                        self.user_id,
+                        self.guid,
+                        self.database,
+                        repository=self.repository
+                    )
+
+            # A reconnect within the TTL starts from the previous session's totals;
+            # the database result below still wins if it is higher
+            cached_daily_ms, cached_monthly_ms = self._get_recent_usage()
+            if cached_daily_ms or cached_monthly_ms:
+                self.daily_duration_ms = cached_daily_ms
+                self.monthly_duration_ms = cached_monthly_ms
+                self.limit_reached = self._check_limits()
+                self.voice_enabled = self.limit_reached is None
+                self.usage_ready.set()
+
+            # Create a fresh session record (replacing one left by a reconnection),
+            # count it against the day and month, and load current usage
+            if self._abuse_detector:
+                # The abuse check on connection only records events, so it overlaps the session start
+                _, summary = await asyncio.gather(
+                    self._abuse_detector.check_on_connection(),
+                    self.repository.start_session(self.guid, self.user_id)
                 )
-                # Check for abuse patterns on connection
-                await self._abuse_detector.check_on_connection()
-
-            # Delete any existing session with the same ID (handles reconnection)
-            # This ensures we can create a fresh session even if one exists
-            await self.repository.voice_sessions.delete_one({"session_id": self.guid})
-
-            # Create session record
-            await self.repository.create_session(self.guid, self.user_id)
-
-            # Increment session counts
-            await self.repository.increment_daily_session_count(self.user_id)
-            await self.repository.increment_monthly_session_count(self.user_id)
-
-            # Load current usage
-            summary = await self.repository.get_user_usage_summary(
-                self.user_id,
-                self.guid
+            else:
+                summary = await self.repository.start_session(self.guid, self.user_id)
+
+            # Update local state, keeping any usage tracked since an early start
+            self.session_duration_ms += summary.session_duration_ms
+            self.daily_duration_ms += max(summary.daily_duration_ms, cached_daily_ms) - cached_daily_ms
+            self.monthly_duration_ms += max(summary.monthly_duration_ms, cached_monthly_ms) - cached_monthly_ms
+
+            logger.info(
+                "[VoiceUsage] Initialized for user %s... - Session: %.2fmin, Daily: %.2fmin, Monthly: %.2fmin",
+                self.user_id[:8],
+                self.session_duration_ms / 60000,
+                self.daily_duration_ms / 60000,
+                self.monthly_duration_ms / 60000
             )
 
-            # Update local state
-            self.session_duration_ms = summary.session_duration_ms
-            self.daily_duration_ms = summary.daily_duration_ms
-            self.monthly_duration_ms = summary.monthly_duration_ms
-            self.voice_enabled = summary.voice_enabled
-            self.limit_reached = summary.limit_reached
-
-            print(f"[VoiceUsage] Initialized for user {self.user_id[:8]}... - "
-                  f"Session: {self.session_duration_ms/60000:.2f}min, "
-                  f"Daily: {self.daily_duration_ms/60000:.2f}min, "
-                  f"Monthly: {self.monthly_duration_ms/60000:.2f}min")
-
             # Check if already at limit
-            if self.limit_reached:
-                await self._handle_limit_reached(self.limit_reached)
+            limit_type = self._check_limits()
+            if limit_type:
+                self.voice_enabled = False
+                self.limit_reached = limit_type
+                if not self._limit_handled:
+                    self._limit_handled = True
+                    await self._handle_limit_reached(limit_type)
 
+            summary.voice_enabled = self.voice_enabled
+            summary.limit_reached = self.limit_reached
             return summary
 
         except Exception as e:
-            print(f"[VoiceUsage] Error initializing: {e}")
+            logger.error("[VoiceUsage] Error initializing: %s", e)
             # On error, allow voice to prevent breaking the session
             return self._create_unlimited_summary()
+        finally:
+            self.usage_ready.set()
+
+    def _get_recent_usage(self) -> tuple[int, int]:
+        """Get (daily_ms, monthly_ms) from this user's last session, or zeros if stale."""
+        entry = self._recent_usage.get(self.user_id)
+        if (entry is None
+                or time.monotonic() - entry[0] >= self.RECENT_USAGE_TTL_SECONDS
+                or entry[1] != datetime.utcnow().strftime("%Y-%m-%d")):
+            return 0, 0
+        return entry[2], entry[3]
+
+    def _remember_recent_usage(self):
+        """Record this session's day and month totals for a quick reconnect."""
+        recent = self._recent_usage
+        recent[self.user_id] = (
+            time.monotonic(),
+            datetime.utcnow().strftime("%Y-%m-%d"),
+            self.daily_duration_ms,
+            self.monthly_duration_ms
+        )
+        recent.move_to_end(self.user_id)
+        while len(recent) > self.RECENT_USAGE_MAX_USERS:
+            recent.popitem(last=False)
 
-    async def track_audio_chunk(self, audio_data: str) -> bool:
+    async def track_audio_chunk(self, audio_data: str | bytes) -> bool:
         """
         Track an audio chunk being sent to the client.
 
         Args:
-            audio_data: Base64 encoded audio data
+            audio_data: Base64 encoded audio data, or the raw audio bytes
 
         Returns:
             True if audio should be sent, False if limit reached
@@ -170,22 +300,33 @@ class VoiceUsageTracker:
         if not self.enabled:
             return True
 
+        if not self.usage_ready.is_set():
+            # Usage is still loading; hold the chunk until the limits are known
+            await self.usage_ready.wait()
+
         if not self.voice_enabled:
             return False
 
         try:
-            # Decode base64 to get actual byte count
-            audio_bytes = base64.b64decode(audio_data)
-            bytes_count = len(audio_bytes)
+            # Raw bytes are measured directly; base64 length gives the byte count without decoding
+            if isinstance(audio_data, (bytes, bytearray, memoryview)):
+                bytes_count = len(audio_data)
+            elif len(audio_data) % 4 == 0:
+                padding = 2 if audio_data.endswith("==") else 1 if audio_data.endswith("=") else 0
+                bytes_count = len(audio_data) // 4 * 3 - padding
+            else:
+                bytes_count = len(base64.b64decode(audio_data))
 
             # Calculate duration in milliseconds
-            # For 16kHz, 16-bit mono PCM: 32 bytes = 1ms
-            duration_ms = bytes_count // AUDIO_BYTES_PER_MS if AUDIO_BYTES_PER_MS > 0 else bytes_count // 32
+            if _BYTES_PER_MS_SHIFT is not None:
+                duration_ms = bytes_count >> _BYTES_PER_MS_SHIFT
+            else:
+                duration_ms = bytes_count // _BYTES_PER_MS
 
             return await self._add_usage(duration_ms)
 
         except Exception as e:
-            print(f"[VoiceUsage] Error tracking chunk: {e}")
+            logger.error("[VoiceUsage] Error tracking chunk: %s", e)
             # On error, allow the audio through
             return True
 
@@ -199,32 +340,42 @@ class VoiceUsageTracker:
         Returns:
             True if within limits, False if limit reached
         """
-        async with self._lock:
-            # Update local counters
-            self.session_duration_ms += duration_ms
-            self.daily_duration_ms += duration_ms
-            self.monthly_duration_ms += duration_ms
+        # Nothing to count for empty or sub-millisecond chunks
+        if duration_ms <= 0:
+            return True
 
-            # Check for warnings first
-            await self._check_warnings()
+        # Update local counters
+        self.session_duration_ms += duration_ms
+        self.daily_duration_ms += duration_ms
+        self.monthly_duration_ms += duration_ms
 
-            # Check limits
-            limit_type = self._check_limits()
+        # Check for warnings first
+        await self._check_warnings()
 
-            if limit_type:
-                self.voice_enabled = False
-                self.limit_reached = limit_type
+        # Check limits
+        limit_type = self._check_limits()
+
+        if limit_type:
+            self.voice_enabled = False
+            self.limit_reached = limit_type
+            # Chunks already in flight can also cross the limit; report it exactly once
+            if not self._limit_handled:
+                self._limit_handled = True
                 await self._handle_limit_reached(limit_type)
-                return False
+            return False
 
-            # Update database (async, non-blocking)
-            asyncio.create_task(self._update_database(duration_ms))
+        # Buffer for the next batched database write
+        self._pending_ms += duration_ms
+        self._pending_chunks += 1
+        if self._pending_ms >= self.FLUSH_THRESHOLD_MS:
+            self._schedule_flush()
+        elif self._flush_handle is None:
+            # One deadline per batch instead of a loop waking for the whole session
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.FLUSH_INTERVAL_SECONDS, self._on_flush_deadline
+            )
 
-            # Track activity for abuse detection (async, non-blocking)
-            if self._abuse_detector:
-                asyncio.create_task(self._abuse_detector.track_activity(duration_ms))
-
-            return True
+        return True
 
     def _check_limits(self) -> Optional[VoiceLimitType]:
         """
@@ -243,6 +394,9 @@ class VoiceUsageTracker:
 
     async def _check_warnings(self):
         """Check and send warnings when approaching limits."""
+        if self._all_warnings_sent:
+            return
+
         if not self._session_warning_sent and self.session_duration_ms >= self.session_warning_ms:
             self._session_warning_sent = True
             await self._send_warning("session", self.session_limit_ms, self.session_duration_ms)
@@ -255,6 +409,11 @@ class VoiceUsageTracker:
             self._monthly_warning_sent = True
             await self._send_warning("monthly", self.monthly_limit_ms, self.monthly_duration_ms)
 
+        # Nothing left to warn about for the rest of the session
+        self._all_warnings_sent = (
+            self._session_warning_sent and self._daily_warning_sent and self._monthly_warning_sent
+        )
+
     async def _send_warning(self, limit_type: str, limit_ms: int, usage_ms: int):
         """Send a warning that a limit is being approached."""
         remaining_ms = limit_ms - usage_ms
@@ -271,12 +430,12 @@ class VoiceUsageTracker:
         await self.dispatcher.broadcast(
             self.guid,
             Message(
-                MessageHeader(MessageType.VOICE_USAGE_WARNING),
+                _WARNING_HEADER,
                 data=warning_data
             )
         )
 
-        print(f"[VoiceUsage] Warning sent - {limit_type}: {remaining_minutes:.1f} min remaining")
+        logger.info("[VoiceUsage] Warning sent - %s: %.1f min remaining", limit_type, remaining_minutes)
 
     async def _handle_limit_reached(self, limit_type: VoiceLimitType):
         """
@@ -286,84 +445,78 @@ class VoiceUsageTracker:
             limit_type: Type of limit that was reached
         """
         # Get limit value for the type
-        limit_minutes = {
-            VoiceLimitType.SESSION: VOICE_LIMIT_SESSION_MINUTES,
-            VoiceLimitType.DAILY: VOICE_LIMIT_DAILY_MINUTES,
-            VoiceLimitType.MONTHLY: VOICE_LIMIT_MONTHLY_MINUTES
-        }.get(limit_type, 0)
-
-        usage_minutes = {
-            VoiceLimitType.SESSION: self.session_duration_ms / 60000,
-            VoiceLimitType.DAILY: self.daily_duration_ms / 60000,
-            VoiceLimitType.MONTHLY: self.monthly_duration_ms / 60000
-        }.get(limit_type, 0)
+        limit_minutes = self.LIMIT_MINUTES.get(limit_type, 0)
+        usage_attribute = self.USAGE_ATTRIBUTES.get(limit_type)
+        usage_minutes = getattr(self, usage_attribute) / 60000 if usage_attribute else 0
 
         # Create limit reached message for client
         limit_data = {
             "limit_type": limit_type.value,
             "limit_minutes": limit_minutes,
             "used_minutes": usage_minutes,
-            "message": self._get_limit_message(limit_type, limit_minutes),
+            "message": self._get_limit_message(limit_type),
             "voice_disabled": True
         }
 
-        # Broadcast limit reached event
+        # Broadcast limit reached event; it carries voice_disabled, so no
+        # separate VOICE_DISABLED event is sent
         await self.dispatcher.broadcast(
             self.guid,
             Message(
-                MessageHeader(MessageType.VOICE_LIMIT_REACHED),
+                _LIMIT_REACHED_HEADER,
                 data=limit_data
             )
         )
 
-        # Broadcast voice disabled event
-        await self.dispatcher.broadcast(
-            self.guid,
-            Message(
-                MessageHeader(MessageType.VOICE_DISABLED),
-                data={"reason": f"{limit_type.value}_limit_reached"}
-            )
-        )
-
         # Record in database
+        self._schedule_flush()
         asyncio.create_task(self._record_limit_reached(limit_type, limit_minutes, usage_minutes))
 
-        print(f"[VoiceUsage] LIMIT REACHED - User: {self.user_id}, Type: {limit_type.value}, "
-              f"Limit: {limit_minutes}min, Usage: {usage_minutes:.2f}min")
+        logger.info(
+            "[VoiceUsage] LIMIT REACHED - User: %s, Type: %s, Limit: %smin, Usage: %.2fmin",
+            self.user_id, limit_type.value, limit_minutes, usage_minutes
+        )
 
-    def _get_limit_message(self, limit_type: VoiceLimitType, limit_minutes: float) -> str:
+    def _get_limit_message(self, limit_type: VoiceLimitType) -> str:
         """Generate a user-friendly limit message."""
-        messages = {
-            VoiceLimitType.SESSION: f"You've reached your session voice limit of {limit_minutes} minutes. Voice responses are now disabled, but text chat continues to work.",
-            VoiceLimitType.DAILY: f"You've reached your daily voice limit of {limit_minutes} minutes. Voice will be available again tomorrow. Text chat continues to work.",
-            VoiceLimitType.MONTHLY: f"You've reached your monthly voice limit of {limit_minutes} minutes. Voice will be available next month. Text chat continues to work."
-        }
-        return messages.get(limit_type, "Voice limit reached. Text chat continues to work.")
-
-    async def _update_database(self, duration_ms: int):
-        """Update database with new usage (async background task)."""
-        try:
-            # Update session
-            await self.repository.update_session_usage(
-                self.guid,
-                duration_ms_increment=duration_ms,
-                chunk_count_increment=1
-            )
-
-            # Update daily
-            await self.repository.update_daily_usage(
-                self.user_id,
-                duration_ms_increment=duration_ms
-            )
-
-            # Update monthly
-            await self.repository.update_monthly_usage(
-                self.user_id,
-                duration_ms_increment=duration_ms
-            )
+        return self.LIMIT_MESSAGES.get(limit_type, "Voice limit reached. Text chat continues to work.")
+
+    def _on_flush_deadline(self):
+        """Flush the batch whose deadline just expired."""
+        self._flush_handle = None
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Start the session's writer unless one is already draining the buffer."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_usage())
+
+    async def _flush_usage(self):
+        """Write buffered usage to the database, one batch at a time, until the buffer is empty."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        # Usage buffered while a write is in flight is picked up by the next iteration
+        while self._pending_chunks:
+            duration_ms, chunk_count = self._pending_ms, self._pending_chunks
+            self._pending_ms = 0
+            self._pending_chunks = 0
+
+            # Abuse detection sees each batch as one stretch of activity
+            if self._abuse_detector:
+                await self._abuse_detector.track_activity(duration_ms)
 
-        except Exception as e:
-            print(f"[VoiceUsage] Error updating database: {e}")
+            try:
+                await self.repository.flush_usage(
+                    self.user_id,
+                    self.guid,
+                    duration_ms_increment=duration_ms,
+                    chunk_count_increment=chunk_count
+                )
+            except Exception as e:
+                logger.error("[VoiceUsage] Error updating database: %s", e)
+                return
 
     async def _record_limit_reached(
         self,
@@ -392,23 +545,32 @@ class VoiceUsageTracker:
             await self.repository.increment_daily_limit_reached(self.user_id)
 
         except Exception as e:
-            print(f"[VoiceUsage] Error recording limit: {e}")
+            logger.error("[VoiceUsage] Error recording limit: %s", e)
 
     async def end_session(self):
         """End the tracking session and finalize records."""
-        if not self.enabled:
+        if not self.enabled or self._session_ended:
             return
+        self._session_ended = True
 
         try:
+            # Let an in-flight write finish, then flush whatever is left
+            if self._flush_task and not self._flush_task.done():
+                await self._flush_task
+            await self._flush_usage()
+            self._remember_recent_usage()
+
             # Check for abuse patterns at session end
             if self._abuse_detector:
                 await self._abuse_detector.check_session_end()
 
             await self.repository.end_session(self.guid)
-            print(f"[VoiceUsage] Session ended - User: {self.user_id}, "
-                  f"Total: {self.session_duration_ms/60000:.2f}min")
+            logger.info(
+                "[VoiceUsage] Session ended - User: %s, Total: %.2fmin",
+                self.user_id, self.session_duration_ms / 60000
+            )
         except Exception as e:
-            print(f"[VoiceUsage] Error ending session: {e}")
+            logger.error("[VoiceUsage] Error ending session: %s", e)
 
     def is_voice_enabled(self) -> bool:
         """Check if voice is currently enabled."""
@@ -426,42 +588,28 @@ class VoiceUsageTracker:
         return min(session_remaining, daily_remaining, monthly_remaining)
 
     def get_usage_summary(self) -> dict:
-        """Get current usage summary."""
-        return {
-            "user_id": self.user_id,
-            "session_id": self.guid,
-            "voice_enabled": self.voice_enabled,
-            "limit_reached": self.limit_reached.value if self.limit_reached else None,
-            "session": {
-                "used_ms": self.session_duration_ms,
-                "limit_ms": self.session_limit_ms,
-                "remaining_ms": max(0, self.session_limit_ms - self.session_duration_ms)
-            },
-            "daily": {
-                "used_ms": self.daily_duration_ms,
-                "limit_ms": self.daily_limit_ms,
-                "remaining_ms": max(0, self.daily_limit_ms - self.daily_duration_ms)
-            },
-            "monthly": {
-                "used_ms": self.monthly_duration_ms,
-                "limit_ms": self.monthly_limit_ms,
-                "remaining_ms": max(0, self.monthly_limit_ms - self.monthly_duration_ms)
-            }
-        }
+        """
+        Get current usage summary.
+
+        The same dict is refreshed in place and returned on every call;
+        callers that need to modify it should copy it first.
+        """
+        summary = self._usage_summary
+        summary["voice_enabled"] = self.voice_enabled
+        summary["limit_reached"] = self.limit_reached.value if self.limit_reached else None
+        for key, used_ms, limit_ms in (
+            ("session", self.session_duration_ms, self.session_limit_ms),
+            ("daily", self.daily_duration_ms, self.daily_limit_ms),
+            ("monthly", self.monthly_duration_ms, self.monthly_limit_ms)
+        ):
+            entry = summary[key]
+            entry["used_ms"] = used_ms
+            entry["remaining_ms"] = max(0, limit_ms - used_ms)
+        return summary
 
     def _create_unlimited_summary(self) -> UserVoiceUsageSummary:
         """Create a summary that indicates unlimited usage (when tracking disabled)."""
-        return UserVoiceUsageSummary(
-            user_id=self.user_id,
-            session_duration_ms=0,
-            daily_duration_ms=0,
-            monthly_duration_ms=0,
-            session_limit_ms=float('inf'),
-            daily_limit_ms=float('inf'),
-            monthly_limit_ms=float('inf'),
-            voice_enabled=True,
-            limit_reached=None
-        )
+        return UserVoiceUsageSummary(user_id=self.user_id, **self.UNLIMITED_SUMMARY_FIELDS)
 
 
 class VoiceUsageInterceptor:
@@ -492,28 +640,26 @@ class VoiceUsageInterceptor:
         """
         Run the interceptor, listening for audio tracking events.
         """
-        print(f"[VoiceUsage] Interceptor started for session {self.guid[:8]}...")
+        logger.debug("[VoiceUsage] Interceptor started for session %s...", self.guid[:8])
 
         try:
             async with await self.dispatcher.subscribe(
                 self.guid,
                 MessageType.VOICE_AUDIO_TRACKED
             ) as subscriber:
+                # Bound once; called for every audio chunk
+                track_audio_chunk = self.tracker.track_audio_chunk
                 async for event in subscriber:
                     audio_data = event.message.data.get("audio")
                     if audio_data:
-                        # Track the audio chunk
-                        allowed = await self.tracker.track_audio_chunk(audio_data)
-
-                        if not allowed:
-                            # Voice was disabled, no further action needed
-                            # The limit reached event has already been broadcast
-                            pass
+                        # Once voice is disabled the limit reached event has already been
+                        # broadcast, so the result needs no handling here
+                        await track_audio_chunk(audio_data)
 
         except asyncio.CancelledError:
-            print(f"[VoiceUsage] Interceptor cancelled for session {self.guid[:8]}...")
+            logger.debug("[VoiceUsage] Interceptor cancelled for session %s...", self.guid[:8])
         except Exception as e:
-            print(f"[VoiceUsage] Interceptor error: {e}")
+            logger.error("[VoiceUsage] Interceptor error: %s", e)
         finally:
             await self.tracker.end_session()
-            print(f"[VoiceUsage] Interceptor stopped for session {self.guid[:8]}...")
+            logger.debug("[VoiceUsage] Interceptor stopped for session %s...", self.guid[:8])
@@ -1,67 +1,112 @@
 # external imports
-import os , uuid , asyncio , logging
+import uuid , asyncio , logging , hashlib , queue , time
+import logging.handlers
+import anyio
+import orjson
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
-from dotenv import load_dotenv
+logger = logging.getLogger("chillpanda")
 from api_request_schemas import (SourceEnum , LanguageEnum, RoleEnum, GenderEnum)
-from fastapi import FastAPI, WebSocket , Request, Query, HTTPException
+from fastapi import FastAPI, WebSocket , WebSocketDisconnect , Request, Query, HTTPException
+from fastapi.responses import HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 # internal imports
 from lib_socket_handler.web_socket_manager import WebsocketManager
 from lib_stt.speech_to_text_deepgram import SpeechToTextDeepgram
-from lib_llm.helpers.llm import LLM
-from lib_llm.helpers.prompt_generator import PromptGenerator
+from lib_llm.helpers.llm import LLM, load_token_encoding
+from lib_llm.helpers.prompt_generator import get_prompt_generator
+from lib_llm.helpers.semantic_cache import SemanticCache
 from lib_llm.large_language_model import LargeLanguageModel
 from lib_tts.text_to_speech_deepgram import TextToSpeechDeepgram
 from lib_tts.text_to_speech_elevenlabs import TextToSpeechElevenLabs
-from lib_tts.text_to_speech_minimax import TextToSpeechMinimax
+from lib_tts.text_to_speech_minimax import TextToSpeechMinimax, close_pooled_connections
 from lib_infrastructure.dispatcher import ( Dispatcher , Message , MessageHeader , MessageType )
 from lib_infrastructure.helpers.global_event_logger import GlobalLoggerAsync
 from lib_infrastructure.helpers.realtime_observability import SessionObserver
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, aclosing
 from app.api import router
 from app.mongodb_manager import mongodb_manager
+from app.llm_provider import close_shared_http_client, warm_up_llm_connection
 from app.voice_management_api import management_router
 # Voice usage tracking imports
 from lib_database.database import Database
 from lib_voice_usage.voice_usage_tracker import VoiceUsageTracker, VoiceUsageInterceptor
-from lib_database.voice_usage_repository import create_voice_usage_indexes
-from app.config import VOICE_USAGE_ENABLED, CORS_ORIGINS, LLM_API_KEY
-
-# loading .env configs
-load_dotenv()
-PORT = int(os.getenv("PORT"))
-OUTPUT_MP3_FILES = "output.mp3"
-DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
-ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-MINIMAX_API_KEY = os.getenv("MINIMAX_API_KEY")
+from lib_voice_usage.abuse_detector import VoiceAbuseDetector, start_abuse_event_writer, stop_abuse_event_writer
+from lib_database.voice_usage_repository import VoiceUsageRepository, create_voice_usage_indexes
+from app.config import (
+    VOICE_USAGE_ENABLED, CORS_ORIGINS, LLM_API_KEY, THREAD_POOL_SIZE, SERVE_STATIC,
+    PORT, WORKERS, MAX_WS_SESSIONS, DEEPGRAM_API_KEY, ELEVENLABS_API_KEY, MINIMAX_API_KEY
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    print("Conneting to memory://")
+    # Records are only enqueued on the event loop; a listener thread does the writing
+    root_logger = logging.getLogger()
+    log_handlers = root_logger.handlers[:]
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    log_listener.start()
+
+    # Sync routes and their blocking MongoDB calls share this pool with every connection
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+
+    logger.info("Connecting to memory://")
     await dispatcher.connect()
-    print("Connected to memory://")
+    logger.info("Connected to memory://")
+
+    # The tokenizer may need a download, so it loads in a thread; until it does (or if it
+    # can't), the voice history window is sized with a character-based estimate
+    try:
+        await asyncio.wait_for(asyncio.to_thread(load_token_encoding), timeout=10)
+    except asyncio.TimeoutError:
+        logger.warning("Tokenizer still loading after 10s; estimating history tokens meanwhile")
+
+    # One cheap request primes the shared HTTP/2 pool; sessions then multiplex on it
+    try:
+        await asyncio.wait_for(warm_up_llm_connection(), timeout=5)
+    except Exception as e:
+        logger.warning("LLM connection warm-up failed: %s", e)
 
     # Initialize voice usage database connection
     if VOICE_USAGE_ENABLED:
-        print("Connecting to MongoDB for voice usage tracking...")
+        logger.info("Connecting to MongoDB for voice usage tracking...")
         await voice_usage_database.connect()
         await create_voice_usage_indexes(voice_usage_database)
-        print("Voice usage database connected")
+        abuse_event_writer = start_abuse_event_writer()
+        logger.info("Voice usage database connected")
 
     yield
 
     # Shutdown
-    print("Disconnecting from memory://")
+    logger.info("Disconnecting from memory://")
     await dispatcher.disconnect()
-    print("Disconnected from memory://")
+    logger.info("Disconnected from memory://")
 
-    # Disconnect voice usage database
+    # Queued abuse events are written before the voice usage database closes below
+    if VOICE_USAGE_ENABLED:
+        await stop_abuse_event_writer(abuse_event_writer)
+
+    # The remaining clients are independent, so they close concurrently: the chat
+    # history clients (pymongo's close blocks, so it runs off the loop), the pool
+    # shared by the async LLM clients, idle pooled Minimax sockets, and the voice usage database
+    shutdown_steps = [
+        asyncio.to_thread(mongodb_manager.close),
+        close_shared_http_client(),
+        close_pooled_connections(),
+    ]
     if VOICE_USAGE_ENABLED:
-        await voice_usage_database.disconnect()
+        shutdown_steps.append(voice_usage_database.disconnect())
+    for result in await asyncio.gather(*shutdown_steps, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.warning("Shutdown step failed: %s", result)
+
+    # Flush queued log records and write directly again
+    log_listener.stop()
+    root_logger.handlers = log_handlers
 
 
 # OpenAPI Tags metadata for grouping endpoints
@@ -148,12 +193,58 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.mount("/public", StaticFiles(directory="public"), name="static")
+# In production nginx serves /public straight from disk, keeping asset traffic off the event loop
+if SERVE_STATIC:
+    app.mount("/public", StaticFiles(directory="public"), name="static")
 templates = Jinja2Templates(directory="templates")
+# The onboarding page has no per-request content, so it is rendered once
+INDEX_HTML = templates.get_template("index.html").render()
+INDEX_HEADERS = {
+    "Cache-Control": "public, max-age=300",
+    "ETag": '"' + hashlib.sha1(INDEX_HTML.encode()).hexdigest() + '"',
+}
 dispatcher = Dispatcher()
 
 # Voice usage database connection (async motor client)
 voice_usage_database = Database()
+# Shared by every session's tracker and abuse detector
+voice_usage_repository = VoiceUsageRepository(voice_usage_database)
+
+# Replies to opening messages, shared across /invoke_llm connections
+prompt_cache = SemanticCache()
+
+
+# (language, gender) -> (TTS provider, voice id)
+_VOICE_MAP = {
+    ("en",    "male"):   ("elevenlabs", "nPczCjzI2devNBz1zQrb"),
+    ("en",    "female"): ("elevenlabs", "hGQkZQUA5RiOXIw7P9iO"),
+    ("zh-TW", "male"):   ("minimax",    "Chinese (Mandarin)_Gentle_Youth"),
+    ("zh-TW", "female"): ("minimax",    "Chinese (Mandarin)_Gentle_Senior"),
+    ("zh-HK", "male"):   ("minimax",    "Cantonese_ProfessionalHost\uff08M)"),
+    ("zh-HK", "female"): ("minimax",    "Cantonese_GentleLady"),
+}
+_DEFAULT_VOICE = ("minimax", "English_expressive_narrator")
+
+
+_DONE_FRAME = '{"event":"done"}'
+
+
+# Caps live WebSocket sessions per worker so a surge can't slow every session down
+_session_slots = asyncio.Semaphore(MAX_WS_SESSIONS)
+
+
+class _SessionEnded(Exception):
+    """Raised by a session component whose normal exit ends the WebSocket session."""
+
+
+def create_abuse_detector(user_id: str, session_id: str) -> VoiceAbuseDetector:
+    return VoiceAbuseDetector(
+        user_id,
+        session_id,
+        voice_usage_database,
+        repository=voice_usage_repository
+    )
+
 
 app.include_router(router)
 app.include_router(management_router)
@@ -164,30 +255,51 @@ app.include_router(management_router)
 # UI to onboard new customers and view logs + customers info
 @app.get("/")
 async def get(request: Request):
-    return templates.TemplateResponse("index.html" ,  {"request": request})
+    if request.headers.get("if-none-match") == INDEX_HEADERS["ETag"]:
+        return Response(status_code=304, headers=INDEX_HEADERS)
+    return HTMLResponse(INDEX_HTML, headers=INDEX_HEADERS)
 
 
 
 @app.websocket("/invoke_llm")
 async def chat_invoke(websocket: WebSocket):
     guid = str(uuid.uuid4())
-    prompt_generator = PromptGenerator()
+    prompt_generator = get_prompt_generator()
     modelInstance = LLM(guid , prompt_generator, LLM_API_KEY)
+    cache_namespace = f"{prompt_generator.language.value}:{prompt_generator.role.value if prompt_generator.role else ''}"
 
     await websocket.accept()
     try:
-        while True:
-            data = await websocket.receive_json()
-            if data : 
-                user_msg=LLM.LLMMessage(role=LLM.Role.USER, content=data['user_msg'])
-                llm_resp = modelInstance.interaction_langchain_synchronous( user_msg )
-                print(llm_resp)
-                await websocket.send_json(llm_resp)
-
-
-
-    except Exception as e:
-        print(f"Client disconnected >>> {e}")
+        async for data in websocket.iter_json():
+            if not data:
+                continue
+            user_msg=LLM.LLMMessage(role=LLM.Role.USER, content=data['user_msg'])
+
+            # Only opening messages are cached; later replies depend on the conversation so far
+            cache_key = None
+            if len(modelInstance.messages) == 1:
+                cache_key, cached_resp = await prompt_cache.get(cache_namespace, user_msg.content)
+                if cached_resp is not None:
+                    modelInstance.add_message(user_msg)
+                    modelInstance.add_message(LLM.LLMMessage(role=LLM.Role.ASSISTANT, content=cached_resp))
+                    await websocket.send_text(orjson.dumps({"delta": cached_resp}).decode())
+                    await websocket.send_text(_DONE_FRAME)
+                    continue
+
+            # Tokens go out as they arrive; a failed send closes the stream so a
+            # client that left stops the generation
+            words = []
+            async with aclosing(modelInstance.interaction( user_msg )) as tokens:
+                async for token in tokens:
+                    words.append(token)
+                    await websocket.send_text(orjson.dumps({"delta": token}).decode())
+            await websocket.send_text(_DONE_FRAME)
+            prompt_cache.put(cache_namespace, cache_key, "".join(words).strip().replace("\n", " "))
+
+    except WebSocketDisconnect:
+        logger.info("Client disconnected")
+    except Exception:
+        logger.exception("chat_invoke failed")
         
 
 
@@ -207,15 +319,27 @@ async def websocket_endpoint(
         await websocket.close(code=4001, reason="user_id is required")
         return
 
+    # Turned away before any component is built; accepted first so the client sees the 1013
+    if _session_slots.locked():
+        await websocket.accept()
+        await websocket.close(code=1013, reason="Server busy, try again later")
+        return
+
     user_id = user_id.strip()
-    if session_id and len(session_id) == 36:
+    # Only well-formed UUIDs continue a session; anything else starts a new one. The id is
+    # kept exactly as sent: history and usage records are looked up by the client's string.
+    try:
+        uuid.UUID(session_id)
         guid = session_id
-    else:
+    except (TypeError, ValueError):
         guid = str(uuid.uuid4())
 
-    language_value = language.value if language else "en"
-    role_value = role.value if role else "none"
-    observer = SessionObserver(guid, user_id, source.value)
+    # Resolve the enum values once; they are passed to every component below
+    source_value = source.value
+    language_value = language.value if language is not None else "en"
+    role_value = role.value if role is not None else "none"
+    gender_value = gender.value if gender is not None else "female"
+    observer = SessionObserver(guid, user_id, source_value)
     observer.log(
         "session",
         "started",
@@ -223,7 +347,7 @@ async def websocket_endpoint(
         role=role_value,
     )
 
-    prompt_generator = PromptGenerator(language or LanguageEnum.english, role)
+    prompt_generator = get_prompt_generator(language or LanguageEnum.english, role)
     modelInstance = LLM(guid, prompt_generator, LLM_API_KEY)
 
     voice_tracker = None
@@ -234,15 +358,10 @@ async def websocket_endpoint(
                 guid=guid,
                 user_id=user_id,
                 dispatcher=dispatcher,
-                database=voice_usage_database
+                database=voice_usage_database,
+                repository=voice_usage_repository,
+                abuse_detector_factory=create_abuse_detector
             )
-            usage_summary = await voice_tracker.initialize()
-            if not usage_summary.voice_enabled:
-                observer.log(
-                    "voice_usage",
-                    "limit_already_reached",
-                    limit=str(usage_summary.limit_reached),
-                )
             voice_interceptor = VoiceUsageInterceptor(
                 guid=guid,
                 tracker=voice_tracker,
@@ -267,7 +386,7 @@ async def websocket_endpoint(
             websocket,
             DEEPGRAM_API_KEY,
             language=language_value,
-            source=source.value,
+            source=source_value,
             observer=observer,
         )
     speech_to_text = create_stt_component()
@@ -275,7 +394,7 @@ async def websocket_endpoint(
         guid,
         modelInstance,
         dispatcher,
-        source.value,
+        source_value,
         observer=observer,
         user_id=user_id,
         mongodb_manager=mongodb_manager,
@@ -283,20 +402,7 @@ async def websocket_endpoint(
         role_value=role_value,
     )
 
-    gender_value = gender.value if gender else "female"
-
-    _VOICE_MAP = {
-        ("en",    "male"):   ("elevenlabs", "nPczCjzI2devNBz1zQrb"),
-        ("en",    "female"): ("elevenlabs", "hGQkZQUA5RiOXIw7P9iO"),
-        ("zh-TW", "male"):   ("minimax",    "Chinese (Mandarin)_Gentle_Youth"),
-        ("zh-TW", "female"): ("minimax",    "Chinese (Mandarin)_Gentle_Senior"),
-        ("zh-HK", "male"):   ("minimax",    "Cantonese_ProfessionalHost\uff08M)"),
-        ("zh-HK", "female"): ("minimax",    "Cantonese_GentleLady"),
-    }
-    _provider, _voice_id = _VOICE_MAP.get(
-        (language_value, gender_value),
-        ("minimax", "English_expressive_narrator"),
-    )
+    _provider, _voice_id = _VOICE_MAP.get((language_value, gender_value), _DEFAULT_VOICE)
 
     def create_tts_component():
         if _provider == "elevenlabs":
@@ -318,84 +424,101 @@ async def websocket_endpoint(
 
     text_to_speech = create_tts_component()
 
-    tasks: dict[str, asyncio.Task] = {}
     error_occurred = None
-    tts_retries_remaining = 1
-    stt_retries_remaining = 1
 
-    try:
-        tasks["STT"] = asyncio.create_task(speech_to_text.run_async(), name="STT")
-        tasks["LLM"] = asyncio.create_task(large_language_model.run_async(), name="LLM")
-        tasks["TTS"] = asyncio.create_task(text_to_speech.run_async(), name="TTS")
-        tasks["WebSocket"] = asyncio.create_task(websocket_manager.run_async(), name="WebSocket")
-        if voice_interceptor:
-            tasks["VoiceInterceptor"] = asyncio.create_task(voice_interceptor.run_async(), name="VoiceInterceptor")
-
-        shutdown = False
-        while tasks and not shutdown:
-            done, _ = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_COMPLETED)
-            for done_task in done:
-                task_name = next((name for name, task in tasks.items() if task is done_task), "unknown")
-                tasks.pop(task_name, None)
-
-                try:
-                    done_task.result()
-                    observer.log("session", "task_completed", task=task_name)
-                    if task_name in {"STT", "LLM", "WebSocket"}:
-                        shutdown = True
-                        break
-                except asyncio.CancelledError:
-                    observer.log("session", "task_cancelled", task=task_name)
-                except Exception as e:
-                    observer.log("session", "task_failed", task=task_name, error=str(e))
-                    if task_name == "STT":
-                        if stt_retries_remaining > 0:
-                            stt_retries_remaining -= 1
-                            observer.log("session", "stt_retrying", retries_left=stt_retries_remaining)
-                            speech_to_text = create_stt_component()
-                            tasks["STT"] = asyncio.create_task(speech_to_text.run_async(), name="STT")
-                            continue
-                        await dispatcher.broadcast(
-                            guid,
-                            Message(
-                                MessageHeader(MessageType.CALL_WEBSOCKET_PUT),
-                                data={
-                                    "is_text": True,
-                                    "is_transcription": False,
-                                    "is_end": True,
-                                    "msg": "Voice transcription is temporarily unavailable. You can keep chatting by text.",
-                                },
-                            ),
-                        )
-                        error_occurred = e
-                        shutdown = True
-                        break
-
-                    if task_name == "TTS":
-                        if tts_retries_remaining > 0:
-                            tts_retries_remaining -= 1
-                            observer.log("session", "tts_retrying", retries_left=tts_retries_remaining)
-                            text_to_speech = create_tts_component()
-                            tasks["TTS"] = asyncio.create_task(text_to_speech.run_async(), name="TTS")
-                            continue
-                        await dispatcher.broadcast(
-                            guid,
-                            Message(
-                                MessageHeader(MessageType.VOICE_DISABLED),
-                                data={"reason": "tts_unavailable"},
-                            ),
-                        )
-                        observer.log("session", "tts_degraded_to_text_only")
-                        continue
-
-                    error_occurred = e
-                    shutdown = True
-                    break
+    async def supervise(name, component, create_component=None, retries=0, on_exhausted=None, ends_session=False):
+        """
+        Run one session component, recreating it after a failure while retries remain.
 
-    except Exception as e:
-        error_occurred = e
-        observer.log("session", "unexpected_error", error=str(e))
+        on_exhausted runs once retries are used up; when it returns True the session
+        carries on without the component, otherwise the failure ends the session.
+        """
+        while True:
+            try:
+                await component.run_async()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                observer.log("session", "task_failed", task=name, error=str(e))
+                if retries > 0:
+                    retries -= 1
+                    observer.log("session", f"{name.lower()}_retrying", retries_left=retries)
+                    component = create_component()
+                    continue
+                if on_exhausted and await on_exhausted():
+                    return
+                raise
+            observer.log("session", "task_completed", task=name)
+            if ends_session:
+                raise _SessionEnded()
+            return
+
+    async def stt_unavailable():
+        await dispatcher.broadcast(
+            guid,
+            Message(
+                MessageHeader(MessageType.CALL_WEBSOCKET_PUT),
+                data={
+                    "is_text": True,
+                    "is_transcription": False,
+                    "is_end": True,
+                    "msg": "Voice transcription is temporarily unavailable. You can keep chatting by text.",
+                },
+            ),
+        )
+        return False
+
+    async def tts_unavailable():
+        await dispatcher.broadcast(
+            guid,
+            Message(
+                MessageHeader(MessageType.VOICE_DISABLED),
+                data={"reason": "tts_unavailable"},
+            ),
+        )
+        observer.log("session", "tts_degraded_to_text_only")
+        return True
+
+    async def load_voice_usage():
+        usage_summary = await voice_tracker.initialize()
+        if not usage_summary.voice_enabled:
+            observer.log(
+                "voice_usage",
+                "limit_already_reached",
+                limit=str(usage_summary.limit_reached),
+            )
+
+    # Nothing above awaits, so the slot checked earlier is still free
+    await _session_slots.acquire()
+    try:
+        # The first component to fail or to end the session cancels the rest
+        async with asyncio.TaskGroup() as tg:
+            # Usage loads alongside the components instead of delaying the connection;
+            # the tracker holds audio back until it is loaded
+            if voice_tracker:
+                tg.create_task(load_voice_usage(), name="VoiceUsageInit")
+            tg.create_task(
+                supervise("STT", speech_to_text, create_stt_component, retries=1,
+                          on_exhausted=stt_unavailable, ends_session=True),
+                name="STT",
+            )
+            tg.create_task(supervise("LLM", large_language_model, ends_session=True), name="LLM")
+            tg.create_task(
+                supervise("TTS", text_to_speech, create_tts_component, retries=1, on_exhausted=tts_unavailable),
+                name="TTS",
+            )
+            tg.create_task(supervise("WebSocket", websocket_manager, ends_session=True), name="WebSocket")
+            if voice_interceptor:
+                tg.create_task(supervise("VoiceInterceptor", voice_interceptor), name="VoiceInterceptor")
+    except* _SessionEnded:
+        pass
+    except* Exception as eg:
+        # Component failures were already logged as task_failed
+        error_occurred = eg.exceptions[0]
     finally:
+        _session_slots.release()
+
+        # In-memory fan-out: never waits on I/O, so it can't hold up teardown
         try:
             await dispatcher.broadcast(
                 guid,
@@ -404,16 +527,12 @@ async def websocket_endpoint(
         except Exception as e:
             observer.log("session", "call_ended_broadcast_failed", error=str(e))
 
-        for pending_task in tasks.values():
-            pending_task.cancel()
-        if tasks:
-            await asyncio.gather(*tasks.values(), return_exceptions=True)
-
         try:
             await websocket_manager.dispose()
         except Exception as e:
             observer.log("session", "websocket_dispose_error", error=str(e))
 
+        # Usually already finalized by the interceptor's own cleanup, making this a no-op
         if voice_tracker:
             try:
                 await voice_tracker.end_session()
@@ -446,7 +565,7 @@ async def websocket_endpoint(
         }
     }
 )
-def api_info():
+async def api_info():
     """
     Get basic API information and status.
     
@@ -459,6 +578,16 @@ def api_info():
     }
 
 
+HEALTH_CACHE_SECONDS = 1.0
+_HEALTHY_RESPONSE = {
+    'status': 'healthy',
+    'database': 'connected',
+    'service': 'Chill Panda API'
+}
+# A healthy result is reused until this time.monotonic() value; failures are never cached
+_healthy_until = 0.0
+
+
 @app.get(
     '/health',
     tags=["Health"],
@@ -499,7 +628,7 @@ This endpoint verifies:
         }
     }
 )
-def health_check():
+async def health_check():
     """
     Check API and database health.
     
@@ -508,15 +637,15 @@ def health_check():
     - **database**: 'connected' or 'disconnected'
     - **error**: Error message if unhealthy (optional)
     """
+    global _healthy_until
+    # Probes from every LB and orchestrator share one ping per second while healthy
+    if time.monotonic() < _healthy_until:
+        return _HEALTHY_RESPONSE
     try:
         # Check MongoDB connection
-        mongodb_manager._ensure_connection()
-        mongodb_manager.client.admin.command('ping')
-        return {
-            'status': 'healthy',
-            'database': 'connected',
-            'service': 'Chill Panda API'
-        }
+        await mongodb_manager.ping()
+        _healthy_until = time.monotonic() + HEALTH_CACHE_SECONDS
+        return _HEALTHY_RESPONSE
     except Exception as e:
         return {
             'status': 'unhealthy',
@@ -524,13 +653,28 @@ def health_check():
             'error': str(e)
         }
 
-@app.on_event("shutdown")
-def shutdown_event():
-    """Cleanup on shutdown"""
-    mongodb_manager.close()
-
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=PORT)
-    print(f"Server Up At : http://localhost:{PORT}/")
+    try:
+        import uvloop  # noqa: F401
+        event_loop = "uvloop"
+    except ImportError:
+        event_loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_protocol = "httptools"
+    except ImportError:
+        http_protocol = "h11"
+    logger.info("Server Up At : http://localhost:%s/ (%s workers)", PORT, WORKERS)
+    # Every component of a session subscribes inside the process that accepted its socket,
+    # so the in-memory dispatcher needs no broker to run several workers
+    uvicorn.run(
+        "main:app" if WORKERS > 1 else app,
+        host="0.0.0.0",
+        port=PORT,
+        workers=WORKERS,
+        loop=event_loop,
+        http=http_protocol,
+        ws="websockets",
+    )
@@ -1,5 +1,5 @@
 import asyncio
-import json
+import orjson
 import uuid
 import websockets
 import os
@@ -12,7 +12,8 @@ async def test_crisis_detection(message_text, expected_critical):
     uri = f"ws://{HOST}:{PORT}/ws/{SOURCE}?language=en"
     async with websockets.connect(uri) as websocket:
         print(f"\n[TEST] Sending: {message_text}")
-        await websocket.send(json.dumps({"transcibed_text": message_text}))
+        # The device source only accepts text frames, so the bytes are decoded before sending
+        await websocket.send(orjson.dumps({"transcibed_text": message_text}).decode())
         
         found_is_critical = None
         
@@ -20,7 +21,7 @@ async def test_crisis_detection(message_text, expected_critical):
         try:
             while True:
                 response = await asyncio.wait_for(websocket.recv(), timeout=10.0)
-                data = json.loads(response)
+                data = orjson.loads(response)
                 print(f"[RECV] {data}")
                 
                 if "is_critical" in data:
@@ -320,7 +320,7 @@ Sends audio file to /ws/phone and receives audio responses
 """
 
 import asyncio
-import json
+import orjson
 import uuid
 import websockets
 import base64
@@ -410,7 +410,7 @@ class AudioWebSocketTester:
                         timeout=1.0
                     )
                     
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     self._process_response(data)
                     
                 except asyncio.TimeoutError:
@@ -455,34 +455,40 @@ class AudioWebSocketTester:
         elif data.get("is_clear_event"):
             print("🧹 [CLEAR] Audio buffer cleared")
     
-    async def save_received_audio(self):
-        """Combine and save all received audio chunks"""
-        if not self.received_audio_chunks:
-            print("\n⚠️  No audio received")
-            return
-        
-        print(f"\n💾 Saving {len(self.received_audio_chunks)} audio chunks...")
-        
-        # Decode all chunks
-        all_audio_data = b""
-        for chunk_base64 in self.received_audio_chunks:
-            all_audio_data += base64.b64decode(chunk_base64)
+    def _write_audio_files(self, pcm_path: str, wav_path: str) -> int:
+        """Decode the buffered chunks and write them as PCM and WAV; returns the byte count"""
+        all_audio_data = b"".join(
+            base64.b64decode(chunk_base64) for chunk_base64 in self.received_audio_chunks
+        )
         
         # Save as raw PCM
-        pcm_path = f"{AUDIO_OUTPUT_DIR}/response_{self.session_id[:8]}.pcm"
         with open(pcm_path, "wb") as f:
             f.write(all_audio_data)
         
-        print(f"✅ Saved PCM: {pcm_path} ({len(all_audio_data)} bytes)")
-        
         # Also save as WAV for easy playback
-        wav_path = f"{AUDIO_OUTPUT_DIR}/response_{self.session_id[:8]}.wav"
         with wave.open(wav_path, 'wb') as wav_file:
             wav_file.setnchannels(1)  # Mono
             wav_file.setsampwidth(2)  # 16-bit
             wav_file.setframerate(16000)  # 16kHz
             wav_file.writeframes(all_audio_data)
         
+        return len(all_audio_data)
+    
+    async def save_received_audio(self):
+        """Combine and save all received audio chunks"""
+        if not self.received_audio_chunks:
+            print("\n⚠️  No audio received")
+            return
+        
+        print(f"\n💾 Saving {len(self.received_audio_chunks)} audio chunks...")
+        
+        pcm_path = f"{AUDIO_OUTPUT_DIR}/response_{self.session_id[:8]}.pcm"
+        wav_path = f"{AUDIO_OUTPUT_DIR}/response_{self.session_id[:8]}.wav"
+        
+        # Decoding and disk writes run in a worker thread so the socket keeps being serviced
+        total_bytes = await asyncio.to_thread(self._write_audio_files, pcm_path, wav_path)
+        
+        print(f"✅ Saved PCM: {pcm_path} ({total_bytes} bytes)")
         print(f"✅ Saved WAV: {wav_path}")
         print(f"🎧 Play with: ffplay {wav_path}\n")
     
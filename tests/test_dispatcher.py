@@ -0,0 +1,101 @@
+import asyncio
+import os
+import sys
+import unittest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib_infrastructure.dispatcher import Dispatcher, Message, MessageHeader, MessageType
+
+GUID = "test-session"
+
+
+def make_message(message_type: MessageType, data) -> Message:
+    return Message(MessageHeader(message_type), data)
+
+
+async def collect(subscriber, count: int) -> list:
+    received = []
+    async for event in subscriber:
+        received.append(event.message.data)
+        if len(received) == count:
+            break
+    return received
+
+
+class TestDispatcher(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.dispatcher = Dispatcher()
+        await self.dispatcher.connect()
+
+    async def asyncTearDown(self):
+        await self.dispatcher.disconnect()
+
+    async def test_delivers_in_broadcast_order(self):
+        async with await self.dispatcher.subscribe(GUID, MessageType.LLM_GENERATED_TEXT) as subscriber:
+            for i in range(5):
+                await self.dispatcher.broadcast(GUID, make_message(MessageType.LLM_GENERATED_TEXT, i))
+            received = await asyncio.wait_for(collect(subscriber, 5), timeout=1)
+        self.assertEqual(received, [0, 1, 2, 3, 4])
+
+    async def test_fans_out_to_every_subscriber(self):
+        async with await self.dispatcher.subscribe(GUID, MessageType.CALL_WEBSOCKET_PUT) as first:
+            async with await self.dispatcher.subscribe(GUID, MessageType.CALL_WEBSOCKET_PUT) as second:
+                await self.dispatcher.broadcast(GUID, make_message(MessageType.CALL_WEBSOCKET_PUT, "a"))
+                await self.dispatcher.broadcast(GUID, make_message(MessageType.CALL_WEBSOCKET_PUT, "b"))
+                first_received, second_received = await asyncio.wait_for(
+                    asyncio.gather(collect(first, 2), collect(second, 2)), timeout=1
+                )
+        self.assertEqual(first_received, ["a", "b"])
+        self.assertEqual(second_received, ["a", "b"])
+
+    async def test_channels_are_isolated(self):
+        async with await self.dispatcher.subscribe(GUID, MessageType.TTS_FLUSH) as subscriber:
+            await self.dispatcher.broadcast(GUID, make_message(MessageType.LLM_GENERATED_TEXT, "other type"))
+            await self.dispatcher.broadcast("other-session", make_message(MessageType.TTS_FLUSH, "other guid"))
+            await self.dispatcher.broadcast(GUID, make_message(MessageType.TTS_FLUSH, "mine"))
+            received = await asyncio.wait_for(collect(subscriber, 1), timeout=1)
+        self.assertEqual(received, ["mine"])
+
+    async def test_close_ends_iteration_of_waiting_reader(self):
+        async with await self.dispatcher.subscribe(GUID, MessageType.TTS_FLUSH) as subscriber:
+            reader = asyncio.create_task(collect(subscriber, 10))
+            await self.dispatcher.broadcast(GUID, make_message(MessageType.TTS_FLUSH, "only"))
+            # Let the reader take the event and block waiting for the next one
+            await asyncio.sleep(0.01)
+            self.assertFalse(reader.done())
+            subscriber.close()
+            received = await asyncio.wait_for(reader, timeout=1)
+        self.assertEqual(received, ["only"])
+
+    async def test_disconnect_ends_iteration_of_waiting_reader(self):
+        async with await self.dispatcher.subscribe(GUID, MessageType.TTS_FLUSH) as subscriber:
+            reader = asyncio.create_task(collect(subscriber, 1))
+            await asyncio.sleep(0.01)
+            await self.dispatcher.disconnect()
+            received = await asyncio.wait_for(reader, timeout=1)
+        self.assertEqual(received, [])
+
+    async def test_unsubscribe_removes_channel(self):
+        channel_name = MessageType.TTS_FLUSH.name + "_" + GUID
+        async with await self.dispatcher.subscribe(GUID, MessageType.TTS_FLUSH) as first:
+            async with await self.dispatcher.subscribe(GUID, MessageType.TTS_FLUSH):
+                self.assertEqual(len(self.dispatcher._channels[channel_name]), 2)
+            self.assertEqual(self.dispatcher._channels[channel_name], {first})
+        self.assertNotIn(channel_name, self.dispatcher._channels)
+
+        # Broadcasting to a channel with no subscribers is a no-op
+        await self.dispatcher.broadcast(GUID, make_message(MessageType.TTS_FLUSH, "dropped"))
+        self.assertNotIn(channel_name, self.dispatcher._channels)
+
+    async def test_get_nowait_returns_none_when_empty(self):
+        async with await self.dispatcher.subscribe(GUID, MessageType.TTS_FLUSH) as subscriber:
+            self.assertIsNone(await self.dispatcher.get_nowait(subscriber))
+            await self.dispatcher.broadcast(GUID, make_message(MessageType.TTS_FLUSH, "queued"))
+            event = await self.dispatcher.get_nowait(subscriber)
+        self.assertEqual(event.message.data, "queued")
+
+
+if __name__ == '__main__':
+    unittest.main()
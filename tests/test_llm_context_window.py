@@ -0,0 +1,100 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib_llm.helpers import llm as llm_module
+from lib_llm.helpers.llm import LLM
+
+
+def count_words(message: dict) -> int:
+    # One token per word keeps the budget arithmetic readable
+    return len((message.get("content") or "").split())
+
+
+@patch.object(llm_module, "LLM_HISTORY_TOKEN_BUDGET", 10)
+@patch.object(llm_module, "_count_tokens", side_effect=count_words)
+class TestContextMessages(unittest.TestCase):
+    @patch.object(llm_module, "get_shared_async_llm_client")
+    def setUp(self, _mock_client):
+        self.llm = LLM("test-session", "system prompt", api_key="test-key", model="4o-mini")
+
+    def add(self, role: LLM.Role, content: str, tool_call_id: str = None):
+        self.llm.add_message(LLM.LLMMessage(role, content, tool_call_id))
+
+    def test_everything_within_budget_is_sent(self, _mock_count):
+        self.add(LLM.Role.USER, "one two three")
+        self.add(LLM.Role.ASSISTANT, "four five")
+        self.assertEqual(self.llm._context_messages(), self.llm.messages)
+
+    def test_oldest_messages_are_dropped_first(self, _mock_count):
+        self.add(LLM.Role.USER, "a b c d")
+        self.add(LLM.Role.ASSISTANT, "e f g h")
+        self.add(LLM.Role.USER, "i j k")
+        self.add(LLM.Role.ASSISTANT, "l m n")
+        window = self.llm._context_messages()
+        self.assertEqual(window[0], self.llm.messages[0])
+        self.assertEqual([m["content"] for m in window[1:]], ["e f g h", "i j k", "l m n"])
+
+    def test_newest_message_over_budget_is_still_sent(self, _mock_count):
+        self.add(LLM.Role.USER, "short")
+        self.add(LLM.Role.USER, " ".join(["word"] * 25))
+        window = self.llm._context_messages()
+        self.assertEqual(window, [self.llm.messages[0], self.llm.messages[-1]])
+
+    def test_window_never_starts_on_tool_message(self, _mock_count):
+        self.add(LLM.Role.USER, "a b c d e f")
+        self.llm.messages.append({"role": "assistant", "content": "x y z", "tool_calls": []})
+        self.add(LLM.Role.TOOL, "p q r s", tool_call_id="call_1")
+        self.add(LLM.Role.ASSISTANT, "t u v w")
+        # Budget alone would start the window at the tool result
+        window = self.llm._context_messages()
+        self.assertEqual([m["role"] for m in window], ["system", "assistant", "tool", "assistant"])
+        self.assertEqual(window[1]["content"], "x y z")
+
+    def test_token_counts_are_cached_and_realigned_after_reset(self, mock_count):
+        self.add(LLM.Role.USER, "one two")
+        self.llm._context_messages()
+        self.llm._context_messages()
+        self.assertEqual(mock_count.call_count, 2)
+
+        self.llm.reset()
+        self.assertEqual(self.llm._token_counts, [])
+        self.add(LLM.Role.USER, "three four five")
+        window = self.llm._context_messages()
+        self.assertEqual(window, self.llm.messages)
+        self.assertEqual(self.llm._token_counts, [count_words(m) for m in self.llm.messages])
+
+
+class TestTokenCounting(unittest.TestCase):
+    def test_falls_back_to_estimate_when_tokenizer_cannot_load(self):
+        with patch.object(llm_module, "_encoding", None), \
+                patch.object(llm_module.tiktoken, "get_encoding", side_effect=ConnectionError("offline")):
+            with self.assertLogs(llm_module.logger, level="WARNING"):
+                llm_module.load_token_encoding()
+            self.assertIsNone(llm_module._encoding)
+            self.assertEqual(llm_module._count_tokens({"role": "user", "content": "x" * 40}), 10)
+
+    @patch.object(llm_module, "_encoding", None)
+    @patch.object(llm_module.tiktoken, "get_encoding", side_effect=ConnectionError("offline"))
+    @patch.object(llm_module, "get_shared_async_llm_client")
+    def test_turns_never_load_the_tokenizer(self, _mock_client, mock_get_encoding):
+        chat = LLM("test-session", "system prompt", api_key="test-key", model="4o-mini")
+        chat.add_message(LLM.LLMMessage(LLM.Role.USER, "hello there"))
+        self.assertEqual(chat._context_messages(), chat.messages)
+        mock_get_encoding.assert_not_called()
+
+    def test_loaded_tokenizer_is_used(self):
+        class FakeEncoding:
+            def encode(self, text):
+                return text.split()
+
+        with patch.object(llm_module, "_encoding", FakeEncoding()):
+            self.assertEqual(llm_module._count_tokens({"role": "user", "content": "one two three"}), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib_llm.helpers import semantic_cache as semantic_cache_module
+from lib_llm.helpers.semantic_cache import SemanticCache
+
+# The two sleep prompts are near-duplicates (cosine ~0.99); the weather prompt is unrelated
+VECTORS = {
+    "I can't sleep": np.array([1.0, 0.0, 0.0], dtype=np.float32),
+    "I cannot sleep": np.array([0.99, 0.141, 0.0], dtype=np.float32),
+    "What's the weather like?": np.array([0.0, 0.0, 1.0], dtype=np.float32),
+}
+
+
+class StubbedSemanticCache(SemanticCache):
+    async def _embed(self, text: str) -> np.ndarray:
+        vector = VECTORS[text]
+        return vector / np.linalg.norm(vector)
+
+
+class TestSemanticCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache = StubbedSemanticCache(threshold=0.93, ttl_seconds=60, max_entries=10)
+        self.cache.enabled = True
+
+    async def test_similar_prompt_is_a_hit(self):
+        key, reply = await self.cache.get("chat:en:", "I can't sleep")
+        self.assertIsNone(reply)
+        self.cache.put("chat:en:", key, "Try a slow breath.")
+
+        _, reply = await self.cache.get("chat:en:", "I cannot sleep")
+        self.assertEqual(reply, "Try a slow breath.")
+
+    async def test_dissimilar_prompt_is_a_miss(self):
+        key, _ = await self.cache.get("chat:en:", "I can't sleep")
+        self.cache.put("chat:en:", key, "Try a slow breath.")
+
+        key, reply = await self.cache.get("chat:en:", "What's the weather like?")
+        self.assertIsNone(reply)
+        self.assertIsNotNone(key)
+
+    async def test_entries_expire_after_ttl(self):
+        with patch.object(semantic_cache_module.time, "monotonic", return_value=1000.0):
+            key, _ = await self.cache.get("chat:en:", "I can't sleep")
+            self.cache.put("chat:en:", key, "Try a slow breath.")
+
+        with patch.object(semantic_cache_module.time, "monotonic", return_value=1059.0):
+            _, reply = await self.cache.get("chat:en:", "I can't sleep")
+        self.assertEqual(reply, "Try a slow breath.")
+
+        with patch.object(semantic_cache_module.time, "monotonic", return_value=1060.0):
+            _, reply = await self.cache.get("chat:en:", "I can't sleep")
+        self.assertIsNone(reply)
+        self.assertEqual(len(self.cache._entries["chat:en:"]), 0)
+
+    async def test_namespaces_are_isolated(self):
+        key, _ = await self.cache.get("chat:en:", "I can't sleep")
+        self.cache.put("chat:en:", key, "Try a slow breath.")
+
+        _, reply = await self.cache.get("chat:zh-HK:", "I can't sleep")
+        self.assertIsNone(reply)
+
+    async def test_put_without_key_does_nothing(self):
+        self.cache.put("chat:en:", None, "Try a slow breath.")
+        self.assertEqual(self.cache._entries, {})
+
+        _, reply = await self.cache.get("chat:en:", "I can't sleep")
+        self.assertIsNone(reply)
+
+    async def test_disabled_cache_skips_embedding(self):
+        self.cache.enabled = False
+        with patch.object(StubbedSemanticCache, "_embed") as mock_embed:
+            self.assertEqual(await self.cache.get("chat:en:", "I can't sleep"), (None, None))
+        mock_embed.assert_not_called()
+
+    async def test_embedding_failure_bypasses_cache(self):
+        with patch.object(StubbedSemanticCache, "_embed", side_effect=RuntimeError("Embedding Error")):
+            with self.assertLogs(semantic_cache_module.logger, level="WARNING"):
+                result = await self.cache.get("chat:en:", "I can't sleep")
+        self.assertEqual(result, (None, None))
+
+
+if __name__ == '__main__':
+    unittest.main()